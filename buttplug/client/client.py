@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from asyncio import CancelledError, create_task, Future, get_running_loop, sleep, Task
+from asyncio import CancelledError, create_task, Future, gather, get_running_loop, sleep, Task
 from logging import getLogger, Logger
 from typing import Callable, Optional, Union
 
@@ -57,6 +57,25 @@ class Client:
         # TODO: handle exceptions
         return future.result()
 
+    async def send_many(self, messages: list[Outgoing]) -> list[Incoming]:
+        # All messages are sent in a single packet, replies are returned in the same order
+        if not messages:
+            return []
+        loop = get_running_loop()
+        futures = []
+        for message in messages:
+            future = loop.create_future()
+            self._tasks[message.id] = future
+            futures.append(future)
+        try:
+            await self._connector.send(self._encoder.encode(messages))
+        except BaseException:
+            # No reply will come for a packet that was not sent
+            for message in messages:
+                self._tasks.pop(message.id, None)
+            raise
+        return list(await gather(*futures))
+
     def _create_device(self, device) -> None:
         device = Device(
             self,
@@ -145,7 +164,19 @@ class Client:
                     callback(message.data)
 
                 elif isinstance(message, v2.RawReading):
-                    pass  # TODO: Raw endpoints
+                    try:
+                        device = self[message.device_index]
+                    except KeyError:
+                        self._logger.error(f"received data from an unknown device: {message.device_index}")
+                        continue
+                    try:
+                        callback = device.raw_callback(message.endpoint)
+                    except KeyError:
+                        self._logger.error(
+                            f"received data from a raw endpoint which is not subscribed: {message.endpoint}"
+                            f", device: {message.device_index}")
+                        continue
+                    callback(message.data)
 
                 else:
                     self._logger.error(f"Unexpected message received: {message}")
@@ -220,6 +251,10 @@ class Device:
         self._linear_actuators: list[LinearActuator, ...] = []
         self._rotatory_actuators: list[RotatoryActuator, ...] = []
         self._sensors: list[Sensor, ...] = []
+        self._raw_write_endpoints: list[str, ...] = []
+        self._raw_read_endpoints: list[str, ...] = []
+        self._raw_subscribe_endpoints: list[str, ...] = []
+        self._raw_callbacks: dict[str, RawDataCallback] = {}
 
         if self._client.version == ProtocolSpec.v0:
             # v0 stores messages as a list[str]
@@ -414,10 +449,14 @@ class Device:
                         f"(description: {attributes.feature_descriptor}, type: {attributes.sensor_type})")
             # v3.SensorUnsubscribeCmd is implicitly combined with v3.SensorSubscribeCmd
 
-            # TODO: Raw endpoints
-            # v3.RawWriteCmd
-            # v3.RawReadCmd
-            # v3.RawSubscribeCmd
+            # Raw endpoints. Subscriptions go through raw_subscribe, there are no raw
+            # write or read helpers, send v3.RawWriteCmd / v3.RawReadCmd with Client.send
+            for attributes in messages.pop(v3.RawWriteCmd.__name__, []):
+                self._raw_write_endpoints.extend(attributes.endpoint or [])
+            for attributes in messages.pop(v3.RawReadCmd.__name__, []):
+                self._raw_read_endpoints.extend(attributes.endpoint or [])
+            for attributes in messages.pop(v3.RawSubscribeCmd.__name__, []):
+                self._raw_subscribe_endpoints.extend(attributes.endpoint or [])
             # v3.RawUnsubscribeCmd is implicitly combined with v3.RawSubscribeCmd
 
         for message in messages:
@@ -463,6 +502,63 @@ class Device:
     def sensors(self) -> tuple['Sensor', ...]:
         return tuple(self._sensors)
 
+    @property
+    def raw_write_endpoints(self) -> tuple[str, ...]:
+        return tuple(self._raw_write_endpoints)
+
+    @property
+    def raw_read_endpoints(self) -> tuple[str, ...]:
+        return tuple(self._raw_read_endpoints)
+
+    @property
+    def raw_subscribe_endpoints(self) -> tuple[str, ...]:
+        return tuple(self._raw_subscribe_endpoints)
+
+    def raw_callback(self, endpoint: str) -> 'RawDataCallback':
+        return self._raw_callbacks[endpoint]
+
+    async def raw_subscribe(self, endpoint: str, cb: 'RawDataCallback') -> None:
+        self._logger.debug(f"Subscribing to device {self} (index {self._index}) raw endpoint {endpoint}")
+
+        message = await self.send(v2.RawSubscribeCmd(
+            self._index,
+            endpoint,
+        ))
+
+        if isinstance(message, v2.Ok):
+            self._raw_callbacks[endpoint] = cb
+
+        elif isinstance(message, v2.Error):
+            self._logger.error(
+                f"Error while subscribing to raw endpoint (device: {self._index}, endpoint: {endpoint}) "
+                f"code {message.error_code}: {message.error_message}")
+            raise message.error_code.exception(message.error_message)
+
+        else:
+            raise UnexpectedMessageError(
+                f"while subscribing to raw endpoint (device: {self._index}, endpoint: {endpoint}):\n{message}")
+
+    async def raw_unsubscribe(self, endpoint: str) -> None:
+        self._logger.debug(f"Unsubscribing from device {self} (index {self._index}) raw endpoint {endpoint}")
+
+        message = await self.send(v2.RawUnsubscribeCmd(
+            self._index,
+            endpoint,
+        ))
+
+        if isinstance(message, v2.Ok):
+            self._raw_callbacks.pop(endpoint, None)
+
+        elif isinstance(message, v2.Error):
+            self._logger.error(
+                f"Error while unsubscribing from raw endpoint (device: {self._index}, endpoint: {endpoint}) "
+                f"code {message.error_code}: {message.error_message}")
+            raise message.error_code.exception(message.error_message)
+
+        else:
+            raise UnexpectedMessageError(
+                f"while unsubscribing from raw endpoint (device: {self._index}, endpoint: {endpoint}):\n{message}")
+
     async def stop(self) -> None:
         if not self._stop:
             raise UnsupportedCommandError("stop device")
@@ -845,6 +941,7 @@ class ScalarActuator(Actuator):
 Number = Union[int, float]
 Range = tuple[Number, Number]
 SensorDataCallback = Callable[[list[Number]], None]
+RawDataCallback = Callable[[list[int]], None]
 
 
 class Sensor(DevicePart):
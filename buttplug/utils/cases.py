@@ -1,3 +1,4 @@
+from functools import lru_cache
 from re import sub
 
 
@@ -8,11 +9,14 @@ _acronyms = (
 )
 
 
+# Field names come from a small fixed set, so conversions are memoized
+@lru_cache(maxsize=256)
 def pascal_case(s: str) -> str:
     """Transforms strings from snake_case to PascalCase."""
     return ''.join(x.capitalize() if x not in _acronyms else x.upper() for x in s.split('_'))
 
 
+@lru_cache(maxsize=256)
 def snake_case(s: str) -> str:
     """Transforms strings from PascalCase to snake_case."""
     return '_'.join(x.lower() for x in sub('([A-Z][a-z]+)', r' \1', sub('([A-Z]+)', r' \1', s)).split())
@@ -5,22 +5,177 @@ Run this to see what raw data and sensors your device supports
 """
 
 import asyncio
+import functools
+import inspect
+import io
+import json
+import math
+import os
+import sys
 import time
-from buttplug import Client, WebsocketConnector, ProtocolSpec
-from buttplug.messages import v3
+
+# buttplug (and websockets under it) are imported where first needed so
+# importing this module, or failing early, does not pay for them
+
+SERVER_ADDRESS = "ws://localhost:12345"
+
+# Capabilities found on previous runs, keyed by server address and device name
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "buttplug-explorer", "devices.json")
+
+def _load_cache():
+    """Load the cached capabilities as a dict keyed by (server address, device name)"""
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        (address, name): entry
+        for address, devices in data.items()
+        for name, entry in devices.items()
+    }
+
+def _save_cache(cache):
+    """Write the cached capabilities atomically"""
+    import tempfile
+    data = {}
+    for (address, name), entry in cache.items():
+        data.setdefault(address, {})[name] = entry
+    directory = os.path.dirname(CACHE_FILE)
+    os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first so a crash never leaves a truncated cache
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, CACHE_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# Properties that are cheap and side-effect free to read during the info dump
+_SAFE_PROPERTIES = frozenset({
+    'name', 'index', 'removed',
+    'actuators', 'linear_actuators', 'rotatory_actuators', 'sensors',
+})
+
+# Attribute names to dump, computed once per device class
+_ATTR_CACHE: dict[type, tuple[str, ...]] = {}
+
+def _dump_attributes(cls):
+    """Return the public data attributes and safe properties of a device class"""
+    attrs = _ATTR_CACHE.get(cls)
+    if attrs is None:
+        names = []
+        for name in dir(cls):
+            if name.startswith('_'):
+                continue
+            # Inspect the class statically so no property getter is run
+            value = inspect.getattr_static(cls, name)
+            if isinstance(value, property):
+                if name in _SAFE_PROPERTIES:
+                    names.append(name)
+            elif not callable(value) and not hasattr(value, '__get__'):
+                names.append(name)
+        attrs = _ATTR_CACHE[cls] = tuple(names)
+    return attrs
+
+@functools.lru_cache(maxsize=32)
+def _caps(cls):
+    """Return whether a sensor class can subscribe and report ranges"""
+    # Checked on the class so no descriptor is triggered. Every Sensor declares read
+    names = dir(cls)
+    return 'subscribe' in names, 'ranges' in names
 
 class DeviceExplorer:
+    # Client shared by every explorer in the process, created on first use and kept
+    # open until close_shared_client. It and its lock belong to the loop they were made on
+    _shared_client = None
+    _shared_client_loop = None
+    _shared_client_lock = None
+    
     def __init__(self):
         self.client = None
         self.device = None
         
+        # Set whenever sensor or raw data arrives
+        self._data_event = asyncio.Event()
+        self._last_data_time = None
+        self._data_count = 0
+        
+        # Formatted supported-message lines, built on the first dump
+        self._msg_summary = None
+        
+        # Raw data from every subscribed endpoint is funneled into one bounded queue
+        self._events = asyncio.Queue(maxsize=1024)
+        
+        # Cached capabilities and endpoints that accepted writes this run
+        self._cache = {}
+        self._supported_endpoints = set()
+        
+        # Section output is buffered and written to stdout in one go
+        self._buf = io.StringIO()
+        
+        # Progress line currently on screen while monitoring, redrawn below readings
+        self._progress_line = None
+        
+    def _emit(self, msg=""):
+        """Buffer a line of output"""
+        self._buf.write(msg)
+        self._buf.write("\n")
+        
+    def _flush(self):
+        """Write the buffered output to stdout"""
+        sys.stdout.write(self._buf.getvalue())
+        sys.stdout.flush()
+        self._buf.seek(0)
+        self._buf.truncate()
+        
+    async def __aenter__(self):
+        await self.connect()
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        # The shared client stays connected for the next explorer
+        self.client = None
+            
+    @classmethod
+    def _shared_client_lock_for_loop(cls):
+        """Return the shared client lock of the running loop, forgetting any earlier loop's client"""
+        loop = asyncio.get_running_loop()
+        if cls._shared_client_loop is not loop:
+            # A client or lock made under an earlier asyncio.run is bound to a dead loop
+            cls._shared_client_loop = loop
+            cls._shared_client_lock = asyncio.Lock()
+            cls._shared_client = None
+        return cls._shared_client_lock
+        
+    @classmethod
+    async def get_shared_client(cls):
+        """Return the process-wide client, connecting it on first use"""
+        async with cls._shared_client_lock_for_loop():
+            if cls._shared_client is None or not cls._shared_client.connected:
+                from buttplug import Client, WebsocketConnector, ProtocolSpec
+                client = Client("Device Explorer", ProtocolSpec.v3)
+                connector = WebsocketConnector(SERVER_ADDRESS)
+                await client.connect(connector)
+                cls._shared_client = client
+        return cls._shared_client
+        
+    @classmethod
+    async def close_shared_client(cls):
+        """Disconnect the process-wide client, once no explorer needs it any more"""
+        async with cls._shared_client_lock_for_loop():
+            client, cls._shared_client = cls._shared_client, None
+            if client is not None and client.connected:
+                await client.disconnect()
+                print("🔌 Disconnected")
+        
     async def connect(self):
         """Connect to Intiface Central"""
         try:
             print("🔌 Connecting to Intiface Central...")
-            self.client = Client("Device Explorer", ProtocolSpec.v3)
-            connector = WebsocketConnector("ws://localhost:12345")
-            await self.client.connect(connector)
+            self.client = await self.get_shared_client()
             print("✅ Connected!")
             return True
         except Exception as e:
@@ -28,15 +183,20 @@ class DeviceExplorer:
             print("Make sure Intiface Central is running on port 12345")
             return False
             
+    async def reset(self):
+        """Re-run device discovery without reconnecting"""
+        self.device = None
+        self._msg_summary = None
+        return await self.list_devices()
+        
     async def list_devices(self):
         """List all available devices"""
+        from buttplug.messages import v3
         # First, explicitly request device list (like MuchFun does)
         try:
             print("📋 Requesting device list...")
-            device_list = await self.client.send(v3.RequestDeviceList())
-            
-            # Small delay to let devices populate
-            await asyncio.sleep(0.5)
+            # The reply is awaited here, so the device list is already up to date
+            await self.client.send(v3.RequestDeviceList())
             
         except Exception as e:
             print(f"⚠️  Error requesting device list: {e}")
@@ -67,196 +227,329 @@ class DeviceExplorer:
         if not self.device:
             return
             
-        print(f"\n🔍 Exploring {self.device.name} capabilities...")
-        print("=" * 50)
+        # Local aliases for the lookups repeated in every loop iteration
+        dev = self.device
+        emit = self._emit
+        _ga = getattr
+        
+        emit(f"\n🔍 Exploring {dev.name} capabilities...")
+        emit("=" * 50)
+        
+        # Each of these properties builds a new tuple, fetch them once
+        actuators, linear_actuators, rotatory_actuators, sensors = (
+            dev.actuators, dev.linear_actuators, dev.rotatory_actuators, dev.sensors)
         
         # Basic actuators
-        print(f"🎛️  Actuators: {len(self.device.actuators)}")
-        for i, actuator in enumerate(self.device.actuators):
-            print(f"   [{i}] Type: {getattr(actuator, 'type', 'Generic')}")
-            print(f"       Description: {getattr(actuator, 'description', 'N/A')}")
-            print(f"       Step Count: {getattr(actuator, 'step_count', 'N/A')}")
+        emit(f"🎛️  Actuators: {len(actuators)}")
+        for i, actuator in enumerate(actuators):
+            emit(f"   [{i}] Type: {_ga(actuator, 'type', 'Generic')}")
+            emit(f"       Description: {_ga(actuator, 'description', 'N/A')}")
+            emit(f"       Step Count: {_ga(actuator, 'step_count', 'N/A')}")
             
         # Linear actuators
-        print(f"↕️  Linear Actuators: {len(self.device.linear_actuators)}")
-        for i, actuator in enumerate(self.device.linear_actuators):
-            print(f"   [{i}] Description: {getattr(actuator, 'description', 'N/A')}")
+        emit(f"↕️  Linear Actuators: {len(linear_actuators)}")
+        for i, actuator in enumerate(linear_actuators):
+            emit(f"   [{i}] Description: {_ga(actuator, 'description', 'N/A')}")
             
         # Rotatory actuators  
-        print(f"🔄 Rotatory Actuators: {len(self.device.rotatory_actuators)}")
-        for i, actuator in enumerate(self.device.rotatory_actuators):
-            print(f"   [{i}] Description: {getattr(actuator, 'description', 'N/A')}")
+        emit(f"🔄 Rotatory Actuators: {len(rotatory_actuators)}")
+        for i, actuator in enumerate(rotatory_actuators):
+            emit(f"   [{i}] Description: {_ga(actuator, 'description', 'N/A')}")
             
         # Sensors
-        print(f"📊 Sensors: {len(self.device.sensors)}")
-        for i, sensor in enumerate(self.device.sensors):
-            print(f"   [{i}] Type: {getattr(sensor, 'type', 'Unknown')}")
-            print(f"       Description: {getattr(sensor, 'description', 'N/A')}")
-            print(f"       Subscribable: {hasattr(sensor, 'subscribe')}")
-            if hasattr(sensor, 'ranges'):
-                print(f"       Ranges: {sensor.ranges}")
+        emit(f"📊 Sensors: {len(sensors)}")
+        for i, sensor in enumerate(sensors):
+            emit(f"   [{i}] Type: {_ga(sensor, 'type', 'Unknown')}")
+            emit(f"       Description: {_ga(sensor, 'description', 'N/A')}")
+            sub, rng = _caps(type(sensor))
+            emit(f"       Subscribable: {sub}")
+            if rng:
+                emit(f"       Ranges: {sensor.ranges}")
                 
+        self._flush()
+        
     async def test_sensors(self):
         """Test reading sensor data"""
         if not self.device.sensors:
-            print("\n📊 No sensors to test")
+            self._emit("\n📊 No sensors to test")
+            self._flush()
             return
             
-        print(f"\n📊 Testing {len(self.device.sensors)} sensor(s)...")
-        print("-" * 30)
+        self._emit(f"\n📊 Testing {len(self.device.sensors)} sensor(s)...")
+        self._emit("-" * 30)
         
-        for i, sensor in enumerate(self.device.sensors):
-            sensor_type = getattr(sensor, 'type', 'Unknown')
-            print(f"\n🔬 Testing sensor {i}: {sensor_type}")
-            
-            # Try to read sensor data
-            try:
-                if hasattr(sensor, 'read'):
-                    data = await sensor.read()
-                    print(f"   ✅ Read successful: {data}")
-                else:
-                    # Try with SensorReadCmd
-                    message = await self.client.send(v3.SensorReadCmd(
-                        self.device.index,
-                        i,
-                        sensor_type
-                    ))
-                    
-                    if hasattr(message, 'data'):
-                        print(f"   ✅ Raw read successful: {message.data}")
-                    else:
-                        print(f"   ⚠️  Read response: {type(message).__name__}")
-                        
-            except Exception as e:
-                print(f"   ❌ Read failed: {e}")
+        sensors = self.device.sensors
+        subscribable = [(i, sensor) for i, sensor in enumerate(sensors) if _caps(type(sensor))[0]]
+        
+        # Reads and subscriptions overlap, the semaphore caps requests in flight
+        sem = asyncio.Semaphore(4)
+        
+        async def _one_read(sensor):
+            async with sem:
+                return await self._probe_sensor(sensor)
                 
-            # Try subscribing if possible
-            if hasattr(sensor, 'subscribe'):
-                try:
-                    print(f"   🔔 Attempting to subscribe...")
-                    await sensor.subscribe(lambda data, idx=i: self.on_sensor_data(idx, data))
-                    print(f"   ✅ Subscription successful!")
-                except Exception as e:
-                    print(f"   ❌ Subscription failed: {e}")
-                    
+        async def _one_subscribe(i, sensor):
+            async with sem:
+                return await sensor.subscribe(functools.partial(self.on_sensor_data, i))
+                
+        read_reports, results = await asyncio.gather(
+            asyncio.gather(*(_one_read(sensor) for sensor in sensors)),
+            asyncio.gather(*(_one_subscribe(i, sensor) for i, sensor in subscribable), return_exceptions=True),
+        )
+        
+        reports = [
+            [f"\n🔬 Testing sensor {i}: {getattr(sensor, 'type', 'Unknown')}", *report]
+            for i, (sensor, report) in enumerate(zip(sensors, read_reports))
+        ]
+        for (i, _), result in zip(subscribable, results):
+            reports[i].append(f"   🔔 Attempting to subscribe...")
+            if isinstance(result, Exception):
+                reports[i].append(f"   ❌ Subscription failed: {result}")
+            else:
+                reports[i].append(f"   ✅ Subscription successful!")
+                
+        # Print each report in order
+        for report in reports:
+            self._emit("\n".join(report))
+        self._flush()
+            
+    async def _probe_sensor(self, sensor):
+        """Read a single sensor, returning the report lines"""
+        try:
+            data = await sensor.read()
+            return [f"   ✅ Read successful: {data}"]
+        except Exception as e:
+            return [f"   ❌ Read failed: {e}"]
+            
     def on_sensor_data(self, sensor_index, data):
         """Handle sensor data"""
+        if self._progress_line:
+            # End the progress line first so the reading does not overwrite it
+            sys.stdout.write("\n")
         print(f"   📈 Sensor {sensor_index} data: {data}")
+        if self._progress_line:
+            sys.stdout.write(self._progress_line)
+            sys.stdout.flush()
+        self._last_data_time = time.monotonic()
+        self._data_count += 1
+        self._data_event.set()
+        
+    def on_raw_data(self, endpoint, data):
+        """Queue raw endpoint data without blocking the websocket reader"""
+        try:
+            self._events.put_nowait((endpoint, data, time.monotonic_ns()))
+        except asyncio.QueueFull:
+            pass  # Drop when the consumer falls behind
+            
+    async def _drain(self):
+        """Consume raw endpoint data from the event queue"""
+        while True:
+            endpoint, data, _ = await self._events.get()
+            self.on_sensor_data(endpoint, data)
         
     async def test_raw_endpoints(self):
         """Test common raw endpoints"""
-        print(f"\n🔌 Testing raw endpoints...")
-        print("-" * 30)
+        from buttplug.messages import v3
+        self._emit(f"\n🔌 Testing raw endpoints...")
+        self._emit("-" * 30)
         
-        # Common endpoints to try
-        endpoints_to_test = ["tx", "rx", "cmd", "data", "control", "sensor"]
+        # Only probe what the device advertises, anything else is a guaranteed failure
+        dev = self.device
+        write_endpoints = set(dev.raw_write_endpoints)
+        read_endpoints = set(dev.raw_read_endpoints)
+        subscribe_endpoints = set(dev.raw_subscribe_endpoints)
+        endpoints_to_test = list(dict.fromkeys(
+            dev.raw_write_endpoints + dev.raw_read_endpoints + dev.raw_subscribe_endpoints
+        ))
+        if not endpoints_to_test:
+            self._emit("   ⏭️  Device does not advertise any raw endpoints")
+            self._flush()
+            return
+        
+        # Subscribe through the device so readings reach the event queue
+        subscribed = [endpoint for endpoint in endpoints_to_test if endpoint in subscribe_endpoints]
+        subscriptions = asyncio.gather(*(
+            dev.raw_subscribe(endpoint, functools.partial(self.on_raw_data, endpoint))
+            for endpoint in subscribed
+        ), return_exceptions=True)
         
+        # Send every other probe in a single packet, replies come back in the same order
+        probes = []
         for endpoint in endpoints_to_test:
-            print(f"\n📡 Testing endpoint: '{endpoint}'")
-            
-            # Try writing simple data
-            try:
-                message = await self.client.send(v3.RawWriteCmd(
-                    self.device.index,
+            if endpoint in write_endpoints:
+                probes.append((endpoint, v3.RawWriteCmd(
+                    dev.index,
                     endpoint,
                     [0x00, 0x01, 0x02],  # Simple test data
                     write_with_response=False
-                ))
-                
-                if hasattr(message, 'error_code'):
-                    print(f"   ❌ Write failed: {message.error_message}")
-                else:
-                    print(f"   ✅ Write successful to '{endpoint}'")
-                    
-            except Exception as e:
-                print(f"   ❌ Write error: {e}")
-                
-            # Try reading from endpoint
-            try:
-                message = await self.client.send(v3.RawReadCmd(
-                    self.device.index,
+                )))
+            if endpoint in read_endpoints:
+                probes.append((endpoint, v3.RawReadCmd(
+                    dev.index,
                     endpoint,
                     expected_length=10,
                     wait_for_data=False
-                ))
-                
-                if hasattr(message, 'data') and message.data:
-                    print(f"   ✅ Read successful: {message.data}")
-                elif hasattr(message, 'error_code'):
-                    print(f"   ⚠️  Read failed: {message.error_message}")
-                else:
-                    print(f"   ⚠️  No data available")
-                    
-            except Exception as e:
-                print(f"   ❌ Read error: {e}")
-                
-            # Try subscribing to endpoint
-            try:
-                message = await self.client.send(v3.RawSubscribeCmd(
-                    self.device.index,
-                    endpoint
-                ))
-                
-                if hasattr(message, 'error_code'):
-                    print(f"   ❌ Subscribe failed: {message.error_message}")
-                else:
-                    print(f"   ✅ Subscribe successful to '{endpoint}'")
-                    
-            except Exception as e:
-                print(f"   ❌ Subscribe error: {e}")
-                
-    async def monitor_for_data(self, duration=10):
-        """Monitor for incoming sensor/raw data"""
+                )))
+            
+        try:
+            replies = await self.client.send_many([message for _, message in probes])
+        except Exception as e:
+            replies = e
+        finally:
+            # Awaited whatever happens to the probes, so no subscription is left in flight
+            results = await subscriptions
+        if isinstance(replies, Exception):
+            # Undo the subscriptions that went through, nothing will report on them
+            await asyncio.gather(*(
+                dev.raw_unsubscribe(endpoint)
+                for endpoint, result in zip(subscribed, results)
+                if not isinstance(result, Exception)
+            ), return_exceptions=True)
+            self._emit(f"   ❌ Probe error: {replies}")
+            self._flush()
+            return
+            
+        reports = {endpoint: [f"\n📡 Testing endpoint: '{endpoint}'"] for endpoint in endpoints_to_test}
+        for (endpoint, message), reply in zip(probes, replies):
+            if isinstance(message, v3.RawWriteCmd):
+                if not hasattr(reply, 'error_code'):
+                    self._supported_endpoints.add(endpoint)
+                reports[endpoint].append(self._write_report(endpoint, reply))
+            else:
+                reports[endpoint].append(self._read_report(reply))
+        for endpoint, result in zip(subscribed, results):
+            reports[endpoint].append(self._subscribe_report(endpoint, result))
+        for lines in reports.values():
+            self._emit("\n".join(lines))
+        self._flush()
+            
+    @staticmethod
+    def _write_report(endpoint, message):
+        """Describe the reply to a RawWriteCmd"""
+        if hasattr(message, 'error_code'):
+            return f"   ❌ Write failed: {message.error_message}"
+        return f"   ✅ Write successful to '{endpoint}'"
+        
+    @staticmethod
+    def _read_report(message):
+        """Describe the reply to a RawReadCmd"""
+        if hasattr(message, 'data') and message.data:
+            return f"   ✅ Read successful: {message.data}"
+        elif hasattr(message, 'error_code'):
+            return f"   ⚠️  Read failed: {message.error_message}"
+        else:
+            return f"   ⚠️  No data available"
+            
+    @staticmethod
+    def _subscribe_report(endpoint, result):
+        """Describe the outcome of a raw subscription"""
+        if isinstance(result, Exception):
+            return f"   ❌ Subscribe failed: {result}"
+        return f"   ✅ Subscribe successful to '{endpoint}'"
+        
+    async def monitor_for_data(self, duration=10, exit_on_first=False):
+        """Monitor for incoming sensor/raw data, optionally stopping at the first event"""
         print(f"\n👀 Monitoring for {duration} seconds...")
         print("   (Try interacting with your device)")
         print("-" * 30)
         
-        start_time = time.time()
-        data_received = False
+        # Only count data that arrives while monitoring
+        self._data_event.clear()
+        self._data_count = 0
+        
+        # The monotonic clock is immune to wall-clock adjustments
+        deadline = time.monotonic() + duration
         
-        while time.time() - start_time < duration:
-            print(".", end="", flush=True)
-            await asyncio.sleep(1)
+        # Render a single updating progress line until the time runs out,
+        # or until the first data arrives when asked to exit early
+        progress = asyncio.create_task(self._render_progress(deadline, duration))
+        waiter = asyncio.create_task(self._data_event.wait())
+        try:
+            if exit_on_first:
+                await asyncio.wait({progress, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await progress
+        finally:
+            progress.cancel()
+            waiter.cancel()
+            self._progress_line = None
             
-        print(f"\n{'✅ Data received during monitoring!' if data_received else '⚠️  No data received'}")
+        sys.stdout.write("\n")
+        if self._data_count:
+            print(f"✅ Received {self._data_count} data event(s) during monitoring!")
+        else:
+            print("⚠️  No data received")
+        
+    async def _render_progress(self, deadline, duration):
+        """Redraw the progress bar once a second until the deadline"""
+        # Ticks on whole seconds from the start, a fractional duration gets its last
+        # tick on the deadline
+        start = deadline - duration
+        width = math.ceil(duration)
+        t = 0
+        while t < width and time.monotonic() < deadline:
+            t += 1
+            await asyncio.sleep(max(0.0, min(start + t, deadline) - time.monotonic()))
+            self._progress_line = f"\r   [{'#' * t:<{width}}] {min(t, duration):g}/{duration:g}s"
+            sys.stdout.write(self._progress_line)
+            sys.stdout.flush()
         
     async def device_info_dump(self):
         """Dump all available device information"""
         if not self.device:
             return
             
-        print(f"\n📋 Complete device information dump...")
-        print("=" * 50)
+        self._emit(f"\n📋 Complete device information dump...")
+        self._emit("=" * 50)
+        
+        # Local aliases for the lookups repeated in every loop iteration
+        dev = self.device
+        emit = self._emit
+        _ga = getattr
         
         # Device basic info
-        print(f"Name: {self.device.name}")
-        print(f"Index: {self.device.index}")
-        print(f"Removed: {getattr(self.device, 'removed', 'N/A')}")
-        
-        # Try to access internal attributes
-        for attr in dir(self.device):
-            if not attr.startswith('_') and not callable(getattr(self.device, attr)):
-                try:
-                    value = getattr(self.device, attr)
-                    print(f"{attr}: {value}")
-                except:
-                    pass
+        emit(f"Name: {dev.name}")
+        emit(f"Index: {dev.index}")
+        emit(f"Removed: {_ga(dev, 'removed', 'N/A')}")
+        
+        # Dump public attributes, each getter runs exactly once
+        for attr in _dump_attributes(type(dev)):
+            try:
+                emit(f"{attr}: {_ga(dev, attr)}")
+            except Exception:
+                pass
                     
-        # Check if device has message info
-        if hasattr(self.device, '_device_messages'):
-            print(f"\nSupported messages:")
-            for msg_type, msg_info in self.device._device_messages.items():
-                print(f"  {msg_type}: {msg_info}")
+        # Raw messages with their advertised endpoints, stable for a given device
+        if self._msg_summary is None:
+            messages = {
+                'RawReadCmd': dev.raw_read_endpoints,
+                'RawSubscribeCmd': dev.raw_subscribe_endpoints,
+                'RawWriteCmd': dev.raw_write_endpoints,
+            }
+            self._msg_summary = tuple(
+                f"  {msg_type}: {', '.join(endpoints)}"
+                for msg_type, endpoints in sorted(messages.items())
+                if endpoints
+            )
+        if self._msg_summary:
+            emit(f"\nSupported messages:")
+            emit("\n".join(self._msg_summary))
                 
+        self._flush()
+        
     async def run_exploration(self):
         """Run complete device exploration"""
         print("🚀 Device Explorer Starting...")
         print("This will discover what your device can do!")
         
-        # Connect
-        if not await self.connect():
+        # The connection is opened by the async context manager
+        if self.client is None:
             return
             
+        # Show what was found on previous runs before discovery starts
+        self._cache = _load_cache()
+        self._show_cached()
+        
         # Find devices
         if not await self.list_devices():
             return
@@ -267,30 +560,80 @@ class DeviceExplorer:
         # Test sensors
         await self.test_sensors()
         
-        # Test raw endpoints
-        await self.test_raw_endpoints()
-        
-        # Monitor for live data
-        await self.monitor_for_data(10)
+        # Test raw endpoints, their data is consumed until monitoring ends
+        drain = asyncio.create_task(self._drain())
+        try:
+            await self.test_raw_endpoints()
+            
+            # Written once the endpoints are known, so the file is only replaced once per run
+            self._update_cache()
+            
+            # Monitor for live data
+            await self.monitor_for_data(10)
+        finally:
+            drain.cancel()
         
         # Full info dump
         await self.device_info_dump()
         
         print(f"\n✅ Exploration complete!")
-        print(f"📝 Summary for {self.device.name}:")
-        print(f"   • {len(self.device.actuators)} actuator(s)")
-        print(f"   • {len(self.device.linear_actuators)} linear actuator(s)")
-        print(f"   • {len(self.device.rotatory_actuators)} rotatory actuator(s)")
-        print(f"   • {len(self.device.sensors)} sensor(s)")
-        
-        # Disconnect
-        await self.client.disconnect()
-        print("🔌 Disconnected")
+        dev = self.device
+        a, la, ra, s = (dev.actuators, dev.linear_actuators, dev.rotatory_actuators, dev.sensors)
+        print(f"📝 Summary for {dev.name}:")
+        print(f"   • {len(a)} actuator(s)")
+        print(f"   • {len(la)} linear actuator(s)")
+        print(f"   • {len(ra)} rotatory actuator(s)")
+        print(f"   • {len(s)} sensor(s)")
+
+    def _show_cached(self):
+        """Print the capabilities cached for this server by previous runs"""
+        entries = [entry for (address, _), entry in self._cache.items() if address == SERVER_ADDRESS]
+        if not entries:
+            return
+        print(f"\n💾 Cached capabilities from a previous run:")
+        for entry in entries:
+            print(f"  {entry['device_name']}")
+            print(f"   • actuators: {', '.join(entry['actuators']) or 'none'}")
+            print(f"   • {entry['linear_actuators']} linear, {entry['rotatory_actuators']} rotatory actuator(s)")
+            print(f"   • sensors: {', '.join(entry['sensors']) or 'none'}")
+            print(f"   • endpoints: {', '.join(entry['supported_endpoints']) or 'unknown'}")
+            
+    def _cache_entry(self, device):
+        """Describe the capabilities of a device for the cache"""
+        # Endpoints are only known for the explored device, and only when probing worked
+        previous = self._cache.get((SERVER_ADDRESS, device.name), {})
+        endpoints = previous.get('supported_endpoints', [])
+        if device is self.device and self._supported_endpoints:
+            endpoints = sorted(self._supported_endpoints)
+        return {
+            'device_name': device.name,
+            'actuators': [str(getattr(a, 'type', 'Generic')) for a in device.actuators],
+            'linear_actuators': len(device.linear_actuators),
+            'rotatory_actuators': len(device.rotatory_actuators),
+            'sensors': [str(getattr(s, 'type', 'Unknown')) for s in device.sensors],
+            'supported_endpoints': endpoints,
+        }
+        
+    def _update_cache(self):
+        """Replace this server's cache entries with the devices present now"""
+        # Devices that are gone or removed are evicted
+        cache = {key: entry for key, entry in self._cache.items() if key[0] != SERVER_ADDRESS}
+        for device in self.client.devices.values():
+            if not device.removed:
+                cache[(SERVER_ADDRESS, device.name)] = self._cache_entry(device)
+        self._cache = cache
+        try:
+            _save_cache(cache)
+        except OSError as e:
+            print(f"⚠️  Could not write the device cache: {e}")
 
 async def main():
     """Main function"""
-    explorer = DeviceExplorer()
-    await explorer.run_exploration()
+    try:
+        async with DeviceExplorer() as explorer:
+            await explorer.run_exploration()
+    finally:
+        await DeviceExplorer.close_shared_client()
 
 if __name__ == "__main__":
     print("Device Discovery Script")
@@ -7,21 +7,218 @@ Enhanced with frequency band control and circular audio visualizer
 import tkinter as tk
 from tkinter import ttk, messagebox
 import asyncio
+import colorsys
+import functools
 import threading
 import pyaudio
 import numpy as np
+try:
+    # Keeps float32 blocks in complex64, np.fft before NumPy 2 always computes in double
+    from scipy import fft as _fft
+except ImportError:
+    _fft = np.fft
 import time
 import logging
-import traceback
-import os
+import logging.handlers
+import math
+from math import cos, sin
 import queue
+import os
+import sys
 from datetime import datetime
+from pathlib import Path
 from buttplug import Client, WebsocketConnector, ProtocolSpec
 
-# Matplotlib imports for visualizer
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.animation as animation
+# Microphone settings, the stream buffer matches the block read per frame
+AUDIO_CHUNK = 1024
+AUDIO_RATE = 44100
+
+# Much lower threshold for cutting to zero (faster silence response)
+CUTOFF_THRESHOLD = 0.02  # Higher threshold for mechanical devices
+
+# Smoothing types, each resolved to its kernel once when the selection changes
+SMOOTHING_TYPES = ("none", "simple", "adaptive", "momentum")
+
+# Smoothing kernels - plain float math sharing one signature,
+# each returns (result, velocity)
+def _smooth_none(current, target, dt, strength, attack, decay, velocity):
+    """No smoothing"""
+    return target, velocity
+
+def _smooth_simple(current, target, dt, strength, attack, decay, velocity):
+    """Simple exponential smoothing with faster decay to zero"""
+    result = strength * current + (1 - strength) * target
+    
+    # Apply cutoff threshold more aggressively
+    if result < CUTOFF_THRESHOLD:
+        return 0.0, velocity
+    return result, velocity
+
+def _smooth_adaptive(current, target, dt, strength, attack, decay, velocity):
+    """Adaptive smoothing with much faster decay to silence"""
+    # Only the step factor depends on direction, the update itself is shared:
+    # fast attack for increases, 3x faster decay (up to 99% per frame) towards zero
+    if target > current:
+        factor = min(1.0, dt / max(0.01, attack))
+    elif target == 0.0:
+        factor = min(0.99, dt * 3.0 / max(0.01, decay))
+    else:
+        factor = min(1.0, dt / max(0.01, decay))
+    result = current + (target - current) * factor
+        
+    # Apply cutoff threshold more aggressively, anything above it is already positive
+    if result < CUTOFF_THRESHOLD:
+        return 0.0, velocity
+    return min(1.0, result), velocity
+
+def _smooth_momentum(current, target, dt, strength, attack, decay, velocity):
+    """Momentum-based smoothing with faster settling to zero"""
+    # More aggressive settings for faster decay to silence
+    momentum_factor = 0.3   # Reduced from 0.5 for faster response
+    damping_factor = 0.6    # Increased from 0.4 for more damping
+    responsiveness = 2.0
+    
+    # Update velocity from the desired change
+    velocity = momentum_factor * velocity + (1 - momentum_factor) * (target - current) * responsiveness
+    
+    # Apply stronger damping, especially when target is zero
+    damping_multiplier = 3.0 if target == 0.0 else 1.0
+    velocity *= (1 - damping_factor * damping_multiplier * dt)
+    
+    # Calculate new intensity
+    new_intensity = current + velocity * dt
+    
+    # Much more aggressive cutoff for momentum, reset velocity when cutting to zero
+    if new_intensity < CUTOFF_THRESHOLD or target == 0.0:
+        return 0.0, 0.0
+        
+    # Clamp to valid range
+    return max(0.0, min(1.0, new_intensity)), velocity
+
+SMOOTHING_KERNELS = dict(zip(SMOOTHING_TYPES, (_smooth_none, _smooth_simple, _smooth_adaptive, _smooth_momentum)))
+
+# Periodic patterns are sampled once over a full period and looked up by phase,
+# replacing trig calls on every pattern tick. Tables are lists so lookups yield floats
+PATTERN_LUT_SIZE = 4096  # Power of two so the phase wraps with a mask
+
+def _pattern_lut(waveform, period):
+    """Sample a waveform over one period, returns (table, samples per time unit)"""
+    phase = np.arange(PATTERN_LUT_SIZE) * (period / PATTERN_LUT_SIZE)
+    return np.asarray(waveform(phase), dtype=np.float64).tolist(), PATTERN_LUT_SIZE / period
+
+def _heartbeat(cycle):
+    """Double pulse like heartbeat"""
+    return np.where(cycle < 0.3, np.sin(cycle * 10) ** 2,
+                    np.where(cycle < 0.8, np.sin((cycle - 0.3) * 12) ** 2, 0.0))
+
+PATTERN_LUTS = {
+    "wave": _pattern_lut(lambda t: (np.sin(t) + 1) / 2, math.tau),  # Smooth sine wave
+    "pulse": _pattern_lut(lambda t: np.where(t < math.pi, 1.0, 0.0), math.tau),  # Square wave
+    "ramp": _pattern_lut(lambda t: t / math.tau, math.tau),  # Sawtooth wave
+    "steady": _pattern_lut(lambda t: 0.7 + 0.1 * np.sin(t * 0.5), 2 * math.tau),  # Small variations
+    "heartbeat": _pattern_lut(_heartbeat, math.tau),
+}
+
+def _lut_generator(table, samples_per_unit):
+    """Wrap a pattern table as a function of adjusted time"""
+    mask = PATTERN_LUT_SIZE - 1
+    def generate(t):
+        return table[int(t * samples_per_unit) & mask]
+    return generate
+
+def _chaos(t):
+    """Chaotic but smooth changes, not periodic so computed directly"""
+    return (sin(t) * cos(t * 1.618) + 1) / 2
+
+def _fallback_pattern(t):
+    """Default fallback for unknown pattern types"""
+    return 0.5
+
+# Pattern types, each resolved to its generator once when the selection changes
+PATTERN_GENERATORS = {name: _lut_generator(*lut) for name, lut in PATTERN_LUTS.items()}
+PATTERN_GENERATORS["chaos"] = _chaos
+
+# Frequency focus label, indexed by how many of the -0.3 and 0.3 boundaries the focus has passed
+FOCUS_LABELS = ("Bass", "Mids", "Treble")
+
+# Pattern randomness is drawn in batches and consumed one value per tick
+PATTERN_NOISE_SIZE = 1024  # Power of two so the index wraps with a mask
+
+# Visualizer bars start at a small inner circle and span heights 0.1 to 0.9 of
+# the disc radius, colors are precomputed at this many height levels
+VISUALIZER_CENTER = 100  # Canvas is twice this in pixels each way
+VISUALIZER_RADIUS = 95  # Pixels for a radius of 1.0
+VISUALIZER_BACKGROUND = '#1a1a1a'
+VISUALIZER_BACKGROUND_RGB = (0x1a / 255,) * 3
+VISUALIZER_BASE = 0.1
+VISUALIZER_COLOR_LEVELS = 32
+VISUALIZER_LEVEL_SCALE = (VISUALIZER_COLOR_LEVELS - 1) / 0.8
+
+# analyze_frequency_bands result for blocks with nothing to show, one shared
+# read-only instance instead of a fresh zero spectrum per silent block
+SILENT_BANDS = (0.0, 0.0, 0.0, np.zeros(64, dtype=np.float32))
+SILENT_BANDS[3].flags.writeable = False
+
+# Blocks quieter than this RMS are silence, much stricter than the old 0.001
+SILENCE_RMS = 0.008
+
+def _is_silent(audio_data):
+    """Whether a block is below the silence RMS, a single dot product and no FFT"""
+    # Compares the mean square so no sqrt is needed
+    return audio_data.dot(audio_data) / len(audio_data) < SILENCE_RMS * SILENCE_RMS
+
+@functools.lru_cache(maxsize=8)
+def _band_slices(n, sample_rate):
+    """Bin ranges of the bass, mids and treble bands for an n-sample rfft"""
+    freqs = np.fft.rfftfreq(n, 1 / sample_rate)
+    
+    def band(low, high):
+        # Bins are sorted by frequency, so low <= f <= high is one contiguous run
+        return slice(int(np.searchsorted(freqs, low, "left")), int(np.searchsorted(freqs, high, "right")))
+    
+    return band(20, 250), band(250, 4000), band(4000, 20000)
+
+@functools.lru_cache(maxsize=8)
+def _fft_window(n):
+    """Hann window for an n-sample block, scaled to unit mean so windowed bin magnitudes
+    stay on the scale the energy thresholds were tuned for"""
+    window = np.hanning(n).astype(np.float32)
+    window /= window.mean()
+    window.flags.writeable = False
+    return window
+
+@functools.lru_cache(maxsize=8)
+def _visualizer_bins(n):
+    """Log-spaced ranges of an n-bin spectrum averaged into the 64 visualizer bars
+
+    Returns the bars with a non-empty range, their start bins, their bin counts and
+    the end of the last range. Consecutive non-empty ranges touch, so the sums are
+    one np.add.reduceat over the spectrum up to that end
+    """
+    edges = np.logspace(0, np.log10(n), 65).astype(int)
+    starts, ends = edges[:-1], np.minimum(edges[1:], n)
+    bars = np.flatnonzero(ends > starts)
+    counts = (ends[bars] - starts[bars]).astype(np.float32)  # Keeps the averages in float32
+    return bars, starts[bars], counts, int(ends[bars[-1]])
+
+def _visualizer_levels(magnitudes):
+    """Reduce a gated magnitude spectrum to 64 normalized visualizer bar levels"""
+    if len(magnitudes) > 64:
+        bars, starts, counts, end = _visualizer_bins(len(magnitudes))
+        visualizer_data = np.zeros(64, dtype=np.float32)
+        visualizer_data[bars] = np.add.reduceat(magnitudes[:end], starts) / counts
+    else:
+        visualizer_data = np.pad(magnitudes, (0, max(0, 64 - len(magnitudes))))[:64]
+    
+    # Normalize and clean visualizer data with stricter threshold, in place since the
+    # array is always fresh here
+    max_viz = visualizer_data.max()
+    if max_viz > 0:
+        visualizer_data /= max_viz
+        # Much stricter threshold to remove noise in visualizer
+        visualizer_data[visualizer_data < 0.15] = 0  # Increased from 0.05
+    
+    return visualizer_data
 
 class MuchFunApp:
     def __init__(self, root):
@@ -46,11 +243,24 @@ class MuchFunApp:
         self.stream = None
         self.audio_enabled = False
         
+        # Blocks captured by the stream callback, oldest blocks are dropped when full.
+        # Only touched from the event loop, the callback hands blocks over thread-safely.
+        # Created by start_async_loop on the loop thread
+        self._audio_queue = None
+        
+        # FFT input, magnitude, noise floor and noise gate workspaces, reused by every analyzed block
+        self._fft_input = np.empty(AUDIO_CHUNK, dtype=np.float32)
+        self._fft_magnitudes = np.empty(AUDIO_CHUNK // 2 + 1, dtype=np.float32)
+        self._fft_scratch = np.empty(AUDIO_CHUNK // 2 + 1, dtype=np.float32)
+        self._fft_gate = np.empty(AUDIO_CHUNK // 2 + 1, dtype=bool)
+        
         # Control variables
         self.intensity = tk.DoubleVar(value=0.0)
         self.sensitivity = tk.DoubleVar(value=50.0)
         self.update_rate = 1.5 
         self.audio_intensity = 0.0
+        self._last_sent_intensity = 0.0
+        self._last_sent_step = None  # Quantized step the device last received, None when unknown
         self.manual_intensity = 0.0
         
         # NEW: Frequency band control with thread-safe caching
@@ -62,24 +272,42 @@ class MuchFunApp:
         
         # Thread-safe cached values for background threads
         self._cached_frequency_focus = 0.0
+        self._cached_mix_weights = self.frequency_mix_weights(0.0)
         self._cached_sensitivity = 50.0
         self._cached_verbose_logging = False
+        self._cached_pattern_intensity = 50.0
+        self._cached_pattern_rate = 50.0
+        self._cached_pattern_randomness = 0.0
+        
+        # Latest progress bar values (percent), written by the audio and pattern
+        # tasks and pushed into the Tk variables by process_ui_updates
+        self._ui_snapshot = {"bass": 0.0, "mids": 0.0, "treble": 0.0,
+                             "audio": 0.0, "smoothed": 0.0, "pattern": 0.0}
+        self._ui_shown = {}
+        self._label_texts = {}  # Text each slider label last showed
         
-        # Thread-safe UI update queue
-        self.ui_update_queue = queue.Queue()
+        # Status message posted from the event loop, shown on the next Tk idle
+        self._pending_status = None
+        self._status_scheduled = False
         
         # Pattern/Loop control variables
         self.pattern_enabled = False
         self.pattern_type = "wave"
+        self._pattern_fn = PATTERN_GENERATORS[self.pattern_type]
         self.pattern_intensity = tk.DoubleVar(value=50.0)
         self.pattern_rate = tk.DoubleVar(value=50.0)
         self.pattern_randomness = tk.DoubleVar(value=0.0)
         self.pattern_current_intensity = 0.0
-        self.pattern_thread = None
+        self.pattern_future = None
         self.pattern_time = 0.0
+        self._rng = np.random.default_rng()
+        self._noise = self._rng.random(PATTERN_NOISE_SIZE).tolist()
+        self._noise_index = 0
         
         # Audio smoothing settings
         self.smoothing_type = "adaptive"
+        self._smooth_fn = SMOOTHING_KERNELS[self.smoothing_type]
+        self._audio_velocity = 0.0
         self.smoothing_strength = 0.4
         self.attack_time = 0.08
         self.decay_time = 0.1
@@ -90,8 +318,10 @@ class MuchFunApp:
         # Audio visualizer setup
         self.visualizer_enabled = tk.BooleanVar(value=True)
         self.visualizer_animation = None
-        self.visualizer_data = np.zeros(64)  # 64 frequency bins for smooth circular display
-        self.visualizer_smoothed = np.zeros(64)
+        self.visualizer_spectrum = SILENT_BANDS[3]  # Latest gated spectrum, published by the audio task
+        self._visualized_spectrum = None
+        self.visualizer_data = np.zeros(64, dtype=np.float32)  # 64 frequency bins for smooth circular display
+        self.visualizer_smoothed = np.zeros(64, dtype=np.float32)
         
         # UI variables (initialize before UI creation)
         self.smoothing_type_var = None
@@ -104,12 +334,23 @@ class MuchFunApp:
         # Threading
         self.loop = None
         self.loop_thread = None
-        self.audio_thread = None
+        self.audio_future = None
+        self.sender_future = None
         self.running = True
         
+        # Latest requested device intensity, sent by a single sender task. The wakeup
+        # event is created by start_async_loop on the loop thread
+        self._pending_intensity = 0.0
+        self._dirty = None
+        
+        # Bumped by emergency stop, a send started before the bump is dropped. Sends and
+        # stops take the device lock (also made on the loop thread) so none overtakes another
+        self._stop_generation = 0
+        self._device_lock = None
+        
         # Statistics tracking
         self.commands_sent = 0
-        self.last_stats_time = time.time()
+        self.last_stats_time = time.monotonic()
         
         self.setup_ui()
         self.start_async_loop()
@@ -117,28 +358,36 @@ class MuchFunApp:
     def setup_logging(self):
         """Setup logging to both file and console"""
         # Create logs directory if it doesn't exist
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        log_dir = Path("logs")
+        log_dir.mkdir(exist_ok=True)
         
         # Create log filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = os.path.join(log_dir, f"muchfun_{timestamp}.log")
+        log_file = log_dir / f"muchfun_{timestamp}.log"
         
         # Configure logging - start with INFO level
+        # Records are only queued on the calling thread; formatting and the file
+        # and console writes happen on the listener thread, off the audio path
+        log_queue = queue.SimpleQueue()
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()  # Also log to console
-            ]
+            format='%(message)s',  # Full formatting is done by the listener's handlers
+            handlers=[logging.handlers.QueueHandler(log_queue)]
         )
         
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file)
+        console_handler = logging.StreamHandler()  # Also log to console
+        file_handler.setFormatter(formatter)
+        console_handler.setFormatter(formatter)
+        
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+        self._log_listener.start()
+        
         # Log system info
         logger = logging.getLogger('MuchFun')
         logger.info(f"Log file created: {log_file}")
-        logger.info(f"Python version: {os.sys.version}")
+        logger.info(f"Python version: {sys.version}")
         logger.info(f"Platform: {os.name}")
         
     def toggle_verbose_logging(self):
@@ -161,18 +410,11 @@ class MuchFunApp:
         
     def log_exception(self, context="", exc_info=None):
         """Log an exception with full traceback"""
-        if exc_info is None:
-            exc_info = True
-        self.logger.error(f"Exception in {context}", exc_info=exc_info)
-        # Also print to console for immediate visibility
-        print(f"ERROR in {context}:")
-        traceback.print_exc()
+        # The console handler already prints the formatted traceback
+        self.logger.error("Exception in %s", context, exc_info=exc_info or True)
         
     def setup_ui(self):
         """Setup the user interface with new layout"""
-        # Configure dark theme
-        plt.style.use('dark_background')
-        
         # Main frame
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -246,10 +488,10 @@ class MuchFunApp:
         pattern_combo.bind('<<ComboboxSelected>>', self.on_pattern_type_changed)
         
         # Pattern controls (compact)
-        for i, (label, var, var_label) in enumerate([
-            ("Max Intensity:", self.pattern_intensity, "pattern_intensity_label"),
-            ("Pattern Speed:", self.pattern_rate, "pattern_rate_label"),
-            ("Randomness:", self.pattern_randomness, "randomness_label")
+        for i, (label, var, var_label, update_label) in enumerate([
+            ("Max Intensity:", self.pattern_intensity, "pattern_intensity_label", self.update_pattern_intensity_label),
+            ("Pattern Speed:", self.pattern_rate, "pattern_rate_label", self.update_pattern_rate_label),
+            ("Randomness:", self.pattern_randomness, "randomness_label", self.update_randomness_label)
         ]):
             ttk.Label(pattern_frame, text=label).grid(row=i+2, column=0, sticky=tk.W, pady=(10, 0))
             
@@ -260,6 +502,7 @@ class MuchFunApp:
             scale = ttk.Scale(control_frame, from_=0 if i < 2 else 0, to=100 if i < 2 else 100, 
                             orient=tk.HORIZONTAL, variable=var, length=150)
             scale.grid(row=0, column=0, sticky=(tk.W, tk.E))
+            self.bind_label_update(scale, update_label)
             
             label_widget = ttk.Label(control_frame, text="50%")
             label_widget.grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
@@ -334,6 +577,7 @@ class MuchFunApp:
         sensitivity_scale = ttk.Scale(sens_frame, from_=1, to=100, orient=tk.HORIZONTAL,
                                     variable=self.sensitivity, length=150)
         sensitivity_scale.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.bind_label_update(sensitivity_scale, self.update_sensitivity_label)
         
         self.sensitivity_label = ttk.Label(sens_frame, text="50%")
         self.sensitivity_label.grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
@@ -353,6 +597,7 @@ class MuchFunApp:
         self.frequency_focus_scale = ttk.Scale(freq_focus_frame, from_=-1, to=1, orient=tk.HORIZONTAL,
                                              variable=self.frequency_focus, length=200)
         self.frequency_focus_scale.grid(row=0, column=0, sticky=(tk.W, tk.E))
+        self.bind_label_update(self.frequency_focus_scale, self.update_frequency_focus_label)
         
         self.frequency_focus_label = ttk.Label(freq_focus_frame, text="Mids")
         self.frequency_focus_label.grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
@@ -410,7 +655,7 @@ class MuchFunApp:
         ttk.Label(smoothing_frame, text="Type:").grid(row=0, column=0, sticky=tk.W)
         self.smoothing_type_var = tk.StringVar(value=self.smoothing_type)
         smoothing_combo = ttk.Combobox(smoothing_frame, textvariable=self.smoothing_type_var,
-                                     values=["none", "simple", "adaptive", "momentum"],
+                                     values=list(SMOOTHING_TYPES),
                                      state="readonly", width=12)
         smoothing_combo.grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
         smoothing_combo.bind('<<ComboboxSelected>>', self.on_smoothing_type_changed)
@@ -457,7 +702,7 @@ class MuchFunApp:
                                          command=self.toggle_visualizer)
         viz_enable_check.grid(row=0, column=0, sticky=tk.W)
         
-        # Setup matplotlib visualizer
+        # Setup canvas visualizer
         self.setup_visualizer(visualizer_frame)
         
         # Status bar spans both columns
@@ -474,18 +719,16 @@ class MuchFunApp:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         
-        # Bind events
-        self.sensitivity.trace_add('write', self.update_sensitivity_label)
+        # Bind events, intensity is also set from code (emergency stop) so it keeps its trace
         self.intensity.trace_add('write', self.update_intensity_label)
-        self.pattern_intensity.trace_add('write', self.update_pattern_intensity_label)
-        self.pattern_rate.trace_add('write', self.update_pattern_rate_label)
-        self.pattern_randomness.trace_add('write', self.update_randomness_label)
-        self.frequency_focus.trace_add('write', self.update_frequency_focus_label)
         
         # Add thread-safe value caching
         self.sensitivity.trace_add('write', self.cache_sensitivity_value)
         self.frequency_focus.trace_add('write', self.cache_frequency_focus_value)
         self.verbose_logging.trace_add('write', self.cache_verbose_logging_value)
+        self.pattern_intensity.trace_add('write', self.cache_pattern_values)
+        self.pattern_rate.trace_add('write', self.cache_pattern_values)
+        self.pattern_randomness.trace_add('write', self.cache_pattern_values)
         
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -493,78 +736,67 @@ class MuchFunApp:
         # Start statistics update timer
         self.update_statistics()
         
-        # Start UI update queue processor
+        # Progress bars fed from the UI snapshot
+        self._ui_vars = {"bass": self.bass_var, "mids": self.mids_var, "treble": self.treble_var,
+                         "audio": self.audio_level_var, "smoothed": self.smoothed_value_var,
+                         "pattern": self.pattern_level_var}
+        
+        # Start UI update processor
         self.process_ui_updates()
         
     def hsl_to_rgb(self, h, s, l):
         """Convert HSL to RGB color format"""
-        h = h / 360.0
-        s = s / 100.0
-        l = l / 100.0
-        
-        if s == 0:
-            r = g = b = l  # achromatic
-        else:
-            def hue_to_rgb(p, q, t):
-                if t < 0: t += 1
-                if t > 1: t -= 1
-                if t < 1/6: return p + (q - p) * 6 * t
-                if t < 1/2: return q
-                if t < 2/3: return p + (q - p) * (2/3 - t) * 6
-                return p
-            
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-            r = hue_to_rgb(p, q, h + 1/3)
-            g = hue_to_rgb(p, q, h)
-            b = hue_to_rgb(p, q, h - 1/3)
-        
-        return (r, g, b)
+        return colorsys.hls_to_rgb(h / 360.0, l / 100.0, s / 100.0)
     
     def setup_visualizer(self, parent_frame):
         """Setup the circular audio visualizer"""
-        # Create matplotlib figure with dark theme - SMALLER SIZE
-        self.fig, self.ax = plt.subplots(
-            subplot_kw={'projection': 'polar'}, 
-            figsize=(2, 2),  # Reduced from (4, 4) to (2, 2)
-            facecolor='#2b2b2b'
-        )
-        self.fig.patch.set_facecolor('#2b2b2b')
-        
-        # Configure the polar plot for a beautiful circular visualizer
-        self.ax.set_facecolor('#1a1a1a')
-        self.ax.grid(False)
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        self.ax.spines['polar'].set_visible(False)
-        
-        # Create bars for frequency visualization
+        # Plain Tk canvas with a dark disc, no image is rendered or copied per frame
+        size = 2 * VISUALIZER_CENTER
+        self.viz_canvas = tk.Canvas(parent_frame, width=size, height=size, bg='#2b2b2b',
+                                    highlightthickness=0)
+        self.viz_canvas.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.viz_canvas.create_oval(*self._visualizer_box(VISUALIZER_RADIUS), fill=VISUALIZER_BACKGROUND,
+                                    outline=VISUALIZER_BACKGROUND)
+        
+        # Create bars for frequency visualization, one pie slice item per bar. A disc of the
+        # background color drawn over them at the inner circle turns the slices into bars
         self.num_bars = 64
-        self.angles = np.linspace(0, 2 * np.pi, self.num_bars, endpoint=False)
-        self.bars = self.ax.bar(
-            self.angles, 
-            np.zeros(self.num_bars), 
-            width=2*np.pi/self.num_bars, 
-            bottom=0.1,  # Small inner circle
-            align='edge'
-        )
-        
-        # Set initial colors - beautiful gradient using RGB
-        for i, bar in enumerate(self.bars):
-            hue = (i / self.num_bars) * 360
-            r, g, b = self.hsl_to_rgb(hue, 70, 50)
-            bar.set_color((r, g, b))
-            bar.set_alpha(0.8)
-        
-        self.ax.set_ylim(0, 1.0)
-        
-        # Embed in tkinter with better layout
-        self.canvas = FigureCanvasTkAgg(self.fig, master=parent_frame)
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Make the plot tighter to eliminate padding
-        self.fig.tight_layout(pad=0.1)
+        extent = 360 / self.num_bars
+        
+        # Dynamic colors per bar and quantized height, brighter and more saturated and more
+        # opaque when more intense. Tk has no alpha, so opacity is blended into the color
+        heights = np.linspace(0.1, 0.9, VISUALIZER_COLOR_LEVELS)
+        self.bar_colors = [
+            [self.blend_color(self.hsl_to_rgb((i / self.num_bars) * 360, 60 + height * 30, 30 + height * 40),
+                              0.7 + height * 0.3)
+             for height in heights]
+            for i in range(self.num_bars)
+        ]
+        
+        # Set initial colors - beautiful gradient
+        self.bar_initial_colors = [self.blend_color(self.hsl_to_rgb((i / self.num_bars) * 360, 70, 50), 0.8)
+                                   for i in range(self.num_bars)]
+        self.bar_ids = []
+        for i, color in enumerate(self.bar_initial_colors):
+            self.bar_ids.append(self.viz_canvas.create_arc(
+                *self._visualizer_box(VISUALIZER_BASE * VISUALIZER_RADIUS),  # Zero height to start
+                start=i * extent, extent=extent, style=tk.PIESLICE, fill=color, outline=color))
+        self.viz_canvas.create_oval(*self._visualizer_box(VISUALIZER_BASE * VISUALIZER_RADIUS),
+                                    fill=VISUALIZER_BACKGROUND, outline=VISUALIZER_BACKGROUND)
+        
+        # Radius in pixels and color level each bar was last drawn with, -1 for the initial color
+        self.bar_radii = [int(VISUALIZER_BASE * VISUALIZER_RADIUS)] * self.num_bars
+        self.bar_levels = [-1] * self.num_bars
+        
+    def _visualizer_box(self, radius):
+        """Canvas bounding box of a circle of the given pixel radius around the center"""
+        return (VISUALIZER_CENTER - radius, VISUALIZER_CENTER - radius,
+                VISUALIZER_CENTER + radius, VISUALIZER_CENTER + radius)
+        
+    def blend_color(self, rgb, alpha):
+        """Blend an RGB color over the visualizer background into a Tk color string"""
+        return "#%02x%02x%02x" % tuple(round(255 * (alpha * c + (1 - alpha) * b))
+                                       for c, b in zip(rgb, VISUALIZER_BACKGROUND_RGB))
         
     def toggle_visualizer(self):
         """Toggle the audio visualizer"""
@@ -577,172 +809,174 @@ class MuchFunApp:
         """Start the visualizer animation"""
         # Stop any existing animation first
         if self.visualizer_animation is not None:
-            self.visualizer_animation.event_source.stop()
+            self.root.after_cancel(self.visualizer_animation)
             self.visualizer_animation = None
         
-        # Create new animation
-        self.visualizer_animation = animation.FuncAnimation(
-            self.fig, 
-            self.update_visualizer, 
-            frames=None, 
-            interval=50,  # 20 FPS for smooth animation
-            blit=False,
-            cache_frame_data=False,
-            repeat=True
-        )
-        
-        # Force the canvas to draw and start the animation
-        self.canvas.draw()
-        self.canvas.start_event_loop(0.001)  # Kick-start the event loop
+        # Frames are scheduled on the Tk loop, each one reschedules the next
+        self.update_visualizer()
         
         self.logger.info("Audio visualizer started")
             
     def stop_visualizer(self):
         """Stop the visualizer animation"""
         if self.visualizer_animation:
-            self.visualizer_animation.event_source.stop()
+            self.root.after_cancel(self.visualizer_animation)
             self.visualizer_animation = None
         
-        # Clear the bars immediately
-        for bar in self.bars:
-            bar.set_height(0.1)  # Reset to minimum height
+        # Clear the bars immediately, reset to minimum height and the initial colors
+        radius = int((VISUALIZER_BASE + 0.1) * VISUALIZER_RADIUS)
+        for i, color in enumerate(self.bar_initial_colors):
+            self.viz_canvas.coords(self.bar_ids[i], *self._visualizer_box(radius))
+            self.viz_canvas.itemconfigure(self.bar_ids[i], fill=color, outline=color)
+        self.bar_radii = [radius] * self.num_bars
+        self.bar_levels = [-1] * self.num_bars
         
-        # Force redraw
-        self.canvas.draw()
         self.logger.info("Audio visualizer stopped")
         
-    def update_visualizer(self, frame):
+    def update_visualizer(self):
         """Update the visualizer with current audio data"""
+        self.visualizer_animation = None
         if not self.visualizer_enabled.get():
-            return self.bars
+            return
+        
+        try:
+            # Reduce the latest spectrum to bar levels here on the UI timer rather than per
+            # audio block, and only when the audio task has published a new one
+            spectrum = self.visualizer_spectrum
+            if spectrum is not self._visualized_spectrum:
+                self._visualized_spectrum = spectrum
+                self.visualizer_data = _visualizer_levels(spectrum)
+                
+            # Smooth the visualizer data for fluid animation, in place
+            smoothing_factor = 0.3
+            self.visualizer_smoothed *= smoothing_factor
+            self.visualizer_smoothed += (1 - smoothing_factor) * self.visualizer_data
             
-        # Smooth the visualizer data for fluid animation
-        smoothing_factor = 0.3
-        self.visualizer_smoothed = (smoothing_factor * self.visualizer_smoothed + 
-                                   (1 - smoothing_factor) * self.visualizer_data)
-        
-        # Update bar heights and colors
-        for i, bar in enumerate(self.bars):
-            height = max(0.1, self.visualizer_smoothed[i] * 0.8 + 0.1)  # Keep minimum height
-            bar.set_height(height)
+            # Bar heights in whole pixels and color levels for all bars at once
+            heights = np.maximum(0.1, self.visualizer_smoothed * 0.8 + 0.1)  # Keep minimum height
+            radii = ((VISUALIZER_BASE + heights) * VISUALIZER_RADIUS).astype(int).tolist()
+            levels = np.minimum(VISUALIZER_COLOR_LEVELS - 1,
+                                ((heights - 0.1) * VISUALIZER_LEVEL_SCALE + 0.5).astype(int)).tolist()
             
-            # Dynamic color based on frequency and intensity using RGB
-            hue = (i / self.num_bars) * 360
-            lightness = 30 + height * 40  # Brighter when more intense
-            saturation = 60 + height * 30  # More saturated when more intense
-            r, g, b = self.hsl_to_rgb(hue, saturation, lightness)
-            bar.set_color((r, g, b))
-            bar.set_alpha(0.7 + height * 0.3)  # More opaque when more intense
+            # Only bars whose radius or color changed cost a Tcl call
+            canvas = self.viz_canvas
+            for i, (radius, level) in enumerate(zip(radii, levels)):
+                if radius != self.bar_radii[i]:
+                    canvas.coords(self.bar_ids[i], *self._visualizer_box(radius))
+                    self.bar_radii[i] = radius
+                if level != self.bar_levels[i]:
+                    color = self.bar_colors[i][level]
+                    canvas.itemconfigure(self.bar_ids[i], fill=color, outline=color)
+                    self.bar_levels[i] = level
+        except Exception as e:
+            self.log_exception("update_visualizer", exc_info=True)
         
-        return self.bars
+        self.visualizer_animation = self.root.after(50, self.update_visualizer)  # 20 FPS for smooth animation
         
-    def analyze_frequency_bands(self, audio_data, sample_rate=44100):
+    def analyze_frequency_bands(self, audio_data, sample_rate=AUDIO_RATE):
         """Analyze audio data and extract frequency bands with strict noise filtering"""
-        # Perform FFT
-        fft = np.fft.rfft(audio_data)
-        freqs = np.fft.rfftfreq(len(audio_data), 1/sample_rate)
-        magnitudes = np.abs(fft)
-        
         # Much stricter noise filtering approach
-        # 1. Calculate RMS of the original audio signal
-        audio_rms = np.sqrt(np.mean(audio_data**2))
-        
-        # 2. Much higher RMS threshold to avoid picking up background noise/feedback
-        rms_threshold = 0.008  # Increased from 0.001 - much stricter
-        
-        if audio_rms < rms_threshold:
-            # Complete silence - return zeros immediately
-            return 0.0, 0.0, 0.0, np.zeros(64)
+        # 1. and 2. RMS of the original audio signal against a high threshold, to avoid
+        # picking up background noise/feedback
+        if _is_silent(audio_data):
+            # Complete silence - return zeros before paying for the FFT
+            return SILENT_BANDS
+        
+        # Perform FFT on the Hann windowed block to keep leakage out of the noise floor.
+        # The captured block is a read-only view, so the window goes into a workspace
+        if len(audio_data) != len(self._fft_input):
+            self._fft_input = np.empty(len(audio_data), dtype=np.float32)
+        windowed = np.multiply(audio_data, _fft_window(len(audio_data)), out=self._fft_input)
+        fft = _fft.rfft(windowed)
+        if len(fft) != len(self._fft_magnitudes):
+            self._fft_magnitudes = np.empty(len(fft), dtype=np.float32)
+            self._fft_scratch = np.empty(len(fft), dtype=np.float32)
+            self._fft_gate = np.empty(len(fft), dtype=bool)
+        magnitudes = np.abs(fft, out=self._fft_magnitudes)
         
         # 3. Stricter frequency-domain noise gate
         # Use a higher percentile and stricter signal threshold
-        noise_floor = np.percentile(magnitudes, 60)  # Use 60th percentile (was 40th)
+        # Use 60th percentile (was 40th), found by partial selection on a scratch copy
+        # instead of a full sort, interpolated between neighbours like np.percentile
+        scratch = self._fft_scratch
+        np.copyto(scratch, magnitudes)
+        position = 0.6 * (len(scratch) - 1)
+        low = int(position)
+        scratch.partition((low, low + 1))
+        noise_floor = scratch[low] + (scratch[low + 1] - scratch[low]) * (position - low)
         signal_threshold = noise_floor * 3.0  # Signals must be 3x above noise floor (was 2x)
         
-        # Apply stricter noise gate
-        magnitudes = np.where(magnitudes > signal_threshold, magnitudes - noise_floor, 0)
+        # Apply stricter noise gate, in place on the magnitude workspace
+        gated = np.less_equal(magnitudes, signal_threshold, out=self._fft_gate)
+        magnitudes -= noise_floor
+        np.copyto(magnitudes, 0, where=gated)
         
-        # 4. Check if we have any significant frequencies left after noise filtering
-        if np.sum(magnitudes) < 1.0:  # Very little energy remains after filtering
-            return 0.0, 0.0, 0.0, np.zeros(64)
+        # 4. Blocks with little energy left after noise filtering are caught by the total
+        # energy threshold below. The bands cover the spectrum at most once apart from
+        # their shared edge bins, so a separate whole-spectrum sum under 1.0 could never
+        # let through a block that threshold would not reject
         
-        # Define frequency ranges
-        bass_mask = (freqs >= 20) & (freqs <= 250)
-        mids_mask = (freqs >= 250) & (freqs <= 4000)
-        treble_mask = (freqs >= 4000) & (freqs <= 20000)
+        # Frequency ranges, computed once per block size and rate
+        bass_bins, mids_bins, treble_bins = _band_slices(len(audio_data), sample_rate)
         
-        # Calculate energy in each band
-        bass_energy = np.sum(magnitudes[bass_mask]) if np.any(bass_mask) else 0
-        mids_energy = np.sum(magnitudes[mids_mask]) if np.any(mids_mask) else 0
-        treble_energy = np.sum(magnitudes[treble_mask]) if np.any(treble_mask) else 0
+        # Calculate energy in each band, as Python floats so the per-block scalar math
+        # downstream (mixing, smoothing, UI) doesn't go through NumPy scalar ops
+        bass_energy = float(magnitudes[bass_bins].sum())
+        mids_energy = float(magnitudes[mids_bins].sum())
+        treble_energy = float(magnitudes[treble_bins].sum())
         
         # Much stricter total energy threshold
         total_energy = bass_energy + mids_energy + treble_energy
         total_threshold = 15.0  # Increased from 5.0 - much stricter
         
         if total_energy < total_threshold:
-            return 0.0, 0.0, 0.0, np.zeros(64)
+            return SILENT_BANDS
         
         # Normalize energies
         bass_energy /= total_energy
         mids_energy /= total_energy
         treble_energy /= total_energy
         
-        # Create visualizer data with same strict filtering
-        if len(magnitudes) > 64:
-            bin_edges = np.logspace(0, np.log10(len(magnitudes)), 65).astype(int)
-            visualizer_data = np.zeros(64)
-            for i in range(64):
-                start_bin = bin_edges[i]
-                end_bin = min(bin_edges[i+1], len(magnitudes))
-                if end_bin > start_bin:
-                    visualizer_data[i] = np.mean(magnitudes[start_bin:end_bin])
-        else:
-            visualizer_data = np.pad(magnitudes, (0, max(0, 64 - len(magnitudes))))[:64]
-        
-        # Normalize and clean visualizer data with stricter threshold
-        max_viz = np.max(visualizer_data)
-        if max_viz > 0:
-            visualizer_data = visualizer_data / max_viz
-            # Much stricter threshold to remove noise in visualizer
-            visualizer_data = np.where(visualizer_data < 0.15, 0, visualizer_data)  # Increased from 0.05
-        
-        return bass_energy, mids_energy, treble_energy, visualizer_data
+        # The gated spectrum goes to the visualizer, which reduces it to its bars on its
+        # own timer. A copy, since the workspace is overwritten by the next block
+        return bass_energy, mids_energy, treble_energy, magnitudes.copy()
         
     def process_ui_updates(self):
-        """Process UI updates from the queue in the main thread"""
+        """Push the latest snapshot values into the progress bars in the main thread"""
         try:
-            # Process all queued UI updates
-            while True:
-                try:
-                    update_func = self.ui_update_queue.get_nowait()
-                    update_func()  # Execute the UI update
-                except queue.Empty:
-                    break
+            # Only values that changed since the last tick cost a Tcl call
+            shown = self._ui_shown
+            for key, value in self._ui_snapshot.items():
+                if shown.get(key) != value:
+                    self._ui_vars[key].set(value)
+                    shown[key] = value
             
             # Schedule next processing
-            self.root.after(20, self.process_ui_updates)  # Check every 20ms for smooth updates
+            self.root.after(33, self.process_ui_updates)  # ~30 Hz is plenty for progress bars
         except Exception as e:
             self.log_exception("process_ui_updates", exc_info=True)
             
-    def calculate_frequency_mix(self, bass, mids, treble, focus_value):
-        """Calculate the mixed intensity based on frequency focus"""
+    def frequency_mix_weights(self, focus_value):
+        """Bass, mids and treble weights of the mixed intensity for a frequency focus"""
         # focus_value: -1 = bass, 0 = mids, 1 = treble
         if focus_value <= 0:
             # Blend between bass and mids
             blend_factor = (focus_value + 1) / 2  # 0 to 1
-            mixed_intensity = bass * (1 - blend_factor) + mids * blend_factor
+            return (1 - blend_factor, blend_factor, 0.0)
         else:
             # Blend between mids and treble
             blend_factor = focus_value  # 0 to 1
-            mixed_intensity = mids * (1 - blend_factor) + treble * blend_factor
+            return (0.0, 1 - blend_factor, blend_factor)
         
-        return mixed_intensity
+    def calculate_frequency_mix(self, bass, mids, treble):
+        """Calculate the mixed intensity with the cached frequency focus weights"""
+        bass_weight, mids_weight, treble_weight = self._cached_mix_weights
+        return bass * bass_weight + mids * mids_weight + treble * treble_weight
         
     def update_statistics(self):
         """Update command statistics display"""
         try:
-            current_time = time.time()
+            current_time = time.monotonic()
             time_diff = current_time - self.last_stats_time
             
             if time_diff >= 1.0:  # Update every second
@@ -758,94 +992,37 @@ class MuchFunApp:
         
     def apply_audio_smoothing(self, current_intensity, target_intensity, delta_time):
         """Apply different smoothing algorithms with faster decay for silence"""
-        
-        # Much lower threshold for cutting to zero (faster silence response)
-        cutoff_threshold = 0.02  # Higher threshold for mechanical devices
-        
-        if self.smoothing_type == "none":
-            return target_intensity
-            
-        elif self.smoothing_type == "simple":
-            # Simple exponential smoothing with faster decay to zero
-            smooth_factor = self.smoothing_strength
-            result = smooth_factor * current_intensity + (1 - smooth_factor) * target_intensity
-            
-            # Apply cutoff threshold more aggressively
-            if result < cutoff_threshold:
-                return 0.0
-            return result
-            
-        elif self.smoothing_type == "adaptive":
-            # Adaptive smoothing with much faster decay to silence
-            if target_intensity > current_intensity:
-                # Fast attack for increases
-                attack_factor = min(1.0, delta_time / max(0.01, self.attack_time))
-                result = current_intensity + (target_intensity - current_intensity) * attack_factor
-            else:
-                # Much more aggressive decay - especially when target is zero
-                if target_intensity == 0.0:
-                    # When target is zero, use very fast exponential decay
-                    decay_rate = 3.0 / max(0.01, self.decay_time)  # 3x faster decay to zero
-                    decay_factor = 1.0 - min(0.99, delta_time * decay_rate)  # Up to 99% decay per frame
-                    result = current_intensity * decay_factor
-                else:
-                    # When target is not zero, use normal decay
-                    decay_factor = min(1.0, delta_time / max(0.01, self.decay_time))
-                    result = current_intensity + (target_intensity - current_intensity) * decay_factor
-            
-            # Apply cutoff threshold more aggressively
-            if result < cutoff_threshold:
-                return 0.0
-            return max(0.0, min(1.0, result))
-                
-        elif self.smoothing_type == "momentum":
-            # Momentum-based smoothing with faster settling to zero
-            if not hasattr(self, '_audio_velocity'):
-                self._audio_velocity = 0.0
-                
-            # Calculate desired change
-            desired_change = target_intensity - current_intensity
-            
-            # More aggressive settings for faster decay to silence
-            momentum_factor = 0.3   # Reduced from 0.5 for faster response
-            damping_factor = 0.6    # Increased from 0.4 for more damping
-            responsiveness = 2.0
-            
-            # Update velocity
-            self._audio_velocity = (momentum_factor * self._audio_velocity + 
-                                  (1 - momentum_factor) * desired_change * responsiveness)
-            
-            # Apply stronger damping, especially when target is zero
-            damping_multiplier = 3.0 if target_intensity == 0.0 else 1.0
-            self._audio_velocity *= (1 - damping_factor * damping_multiplier * delta_time)
-            
-            # Calculate new intensity
-            new_intensity = current_intensity + self._audio_velocity * delta_time
-            
-            # Much more aggressive cutoff for momentum
-            if new_intensity < cutoff_threshold or target_intensity == 0.0:
-                self._audio_velocity = 0.0  # Reset velocity when cutting to zero
-                return 0.0
-                
-            # Clamp to valid range
-            return max(0.0, min(1.0, new_intensity))
-            
-        return target_intensity
+        result, self._audio_velocity = self._smooth_fn(
+            current_intensity, target_intensity, delta_time, self.smoothing_strength,
+            self.attack_time, self.decay_time, self._audio_velocity)
+        return result
 
     def start_async_loop(self):
         """Start the asyncio event loop in a separate thread"""
         try:
             self.logger.info("Starting async event loop")
+            ready = threading.Event()
             def run_loop():
-                self.loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self.loop)
-                self.loop.run_forever()
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                # Made here so they bind to this loop, on Python 3.9 asyncio primitives
+                # bind to the thread's loop when constructed. Room in the queue for the
+                # ~9 blocks captured during a 200 ms idle poll
+                self._audio_queue = asyncio.Queue(maxsize=10)
+                self._dirty = asyncio.Event()
+                self._device_lock = asyncio.Lock()
+                # Published last, code that finds self.loop set can rely on the objects above
+                self.loop = loop
+                ready.set()
+                loop.run_forever()
             
             self.loop_thread = threading.Thread(target=run_loop, daemon=True)
             self.loop_thread.start()
             
-            # Wait a moment for the loop to start
-            time.sleep(0.1)
+            # The sender needs the loop and its primitives, wait until they exist
+            if not ready.wait(timeout=5.0):
+                raise RuntimeError("Async event loop did not start")
+            self.sender_future = self.run_async(self.sender_task())
             self.logger.info("Async event loop started successfully")
         except Exception as e:
             self.log_exception("start_async_loop", exc_info=True)
@@ -882,7 +1059,8 @@ class MuchFunApp:
             self.logger.info(f"Connected! Found {len(devices)} devices")
             
             if len(devices) > 0:
-                self.device = list(devices.values())[0]
+                self.device = next(iter(devices.values()))
+                self._last_sent_step = None
                 self.logger.info(f"Using device: {self.device.name}")
                 self.root.after(0, self.update_connection_status, True, 
                               f"Connected to {self.device.name}")
@@ -904,6 +1082,16 @@ class MuchFunApp:
         except Exception as e:
             self.root.after(0, self.update_connection_status, False, f"Disconnect error: {e}")
             
+    async def shutdown_connection(self):
+        """Stop the device and disconnect on exit, without reporting back to Tk"""
+        # The Tk thread is blocked waiting for this, so root.after must not be used here
+        try:
+            if self.device:
+                await asyncio.wait_for(self.device.stop(), 1.0)
+        finally:
+            if self.client:
+                await asyncio.wait_for(self.client.disconnect(), 2.0)
+            
     def update_connection_status(self, connected, message):
         """Update connection status in UI"""
         self.connected = connected
@@ -918,6 +1106,19 @@ class MuchFunApp:
             self.device = None
         self.status_text.set(message)
         
+    def post_status(self, message):
+        """Show a status message from the event loop, a burst of them costs one Tk call"""
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after_idle(self.flush_status)
+            
+    def flush_status(self):
+        """Show the latest posted status message in the main thread"""
+        # Cleared before reading, so a message posted meanwhile schedules another flush
+        self._status_scheduled = False
+        self.status_text.set(self._pending_status)
+        
     def toggle_audio(self):
         """Enable/disable audio control"""
         self.audio_enabled = self.audio_enabled_var.get()
@@ -931,29 +1132,30 @@ class MuchFunApp:
         try:
             self.logger.info("Starting microphone input processing")
             
-            if self.audio_thread and self.audio_thread.is_alive():
-                self.logger.warning("Audio thread already running")
+            if self.audio_future and not self.audio_future.done():
+                self.logger.warning("Audio task already running")
                 return
                 
             # Audio settings - microphone only
-            chunk = 512  # Buffer size for audio input
+            chunk = AUDIO_CHUNK  # Same size as each read, so no read spans two buffers
             format = pyaudio.paFloat32
             channels = 1  # Mono microphone input
-            rate = 44100
+            rate = AUDIO_RATE
             
             self.logger.info(f"Audio config - Microphone, Channels: {channels}, Rate: {rate}")
             
-            # Use default microphone
+            # Use default microphone, PortAudio delivers blocks to the callback on its own thread
             self.stream = self.audio.open(
                 format=format,
                 channels=channels,
                 rate=rate,
                 input=True,
-                frames_per_buffer=chunk
+                frames_per_buffer=chunk,
+                stream_callback=self.audio_callback
             )
             
-            self.audio_thread = threading.Thread(target=self.audio_worker, daemon=True)
-            self.audio_thread.start()
+            # Analysis and smoothing run as a task on the event loop
+            self.audio_future = self.run_async(self.audio_task())
             
             self.logger.info("Microphone started successfully")
             self.status_text.set("Microphone audio started")
@@ -966,6 +1168,11 @@ class MuchFunApp:
     def stop_audio(self):
         """Stop audio input processing"""
         self.audio_enabled = False
+        
+        # Cancel the task so it stops at its current await instead of finishing its wait
+        if self.audio_future:
+            self.audio_future.cancel()
+            self.audio_future = None
         if self.stream:
             try:
                 if not self.stream.is_stopped():
@@ -979,13 +1186,11 @@ class MuchFunApp:
         self.bass_energy = 0.0
         self.mids_energy = 0.0
         self.treble_energy = 0.0
-        self.visualizer_data = np.zeros(64)
+        self.visualizer_spectrum = SILENT_BANDS[3]
         
-        self.root.after(0, lambda: self.audio_level_var.set(0))
-        self.root.after(0, lambda: self.smoothed_value_var.set(0))
-        self.root.after(0, lambda: self.bass_var.set(0))
-        self.root.after(0, lambda: self.mids_var.set(0))
-        self.root.after(0, lambda: self.treble_var.set(0))
+        snapshot = self._ui_snapshot
+        snapshot["audio"] = snapshot["smoothed"] = 0.0
+        snapshot["bass"] = snapshot["mids"] = snapshot["treble"] = 0.0
         self.status_text.set("Microphone stopped")
         
     def toggle_pattern(self):
@@ -1001,13 +1206,12 @@ class MuchFunApp:
         try:
             self.logger.info(f"Starting pattern control - Type: {self.pattern_type}")
             
-            if self.pattern_thread and self.pattern_thread.is_alive():
-                self.logger.warning("Pattern thread already running")
+            if self.pattern_future and not self.pattern_future.done():
+                self.logger.warning("Pattern task already running")
                 return
                 
             self.pattern_time = 0.0
-            self.pattern_thread = threading.Thread(target=self.pattern_worker, daemon=True)
-            self.pattern_thread.start()
+            self.pattern_future = self.run_async(self.pattern_task())
             
             self.logger.info("Pattern control started successfully")
             self.status_text.set(f"Pattern control started: {self.pattern_type}")
@@ -1019,126 +1223,80 @@ class MuchFunApp:
     def stop_pattern(self):
         """Stop pattern generation"""
         self.pattern_enabled = False
+        if self.pattern_future:
+            self.pattern_future.cancel()
+            self.pattern_future = None
         self.pattern_current_intensity = 0.0
-        self.root.after(0, lambda: self.pattern_level_var.set(0))
+        self._ui_snapshot["pattern"] = 0.0
         self.status_text.set("Pattern control stopped")
         
-    def generate_pattern_value(self, time_val, pattern_type, rate_factor):
-        """Generate pattern value based on type and time"""
-        import math
-        import random
-        
+    def generate_pattern_value(self, time_val, rate_factor):
+        """Generate pattern value for the selected type at the given time"""
         # Adjust time based on rate (higher rate = faster patterns)
-        adjusted_time = time_val * rate_factor
-        
-        if pattern_type == "wave":
-            # Smooth sine wave
-            return (math.sin(adjusted_time) + 1) / 2
-            
-        elif pattern_type == "pulse":
-            # Square wave with smooth transitions
-            cycle = adjusted_time % (2 * math.pi)
-            if cycle < math.pi:
-                return 1.0
-            else:
-                return 0.0
-                
-        elif pattern_type == "ramp":
-            # Sawtooth wave
-            cycle = adjusted_time % (2 * math.pi)
-            return cycle / (2 * math.pi)
-            
-        elif pattern_type == "steady":
-            # Steady value with small variations
-            return 0.7 + 0.1 * math.sin(adjusted_time * 0.5)
-            
-        elif pattern_type == "chaos":
-            # Chaotic but smooth changes
-            return (math.sin(adjusted_time) * math.cos(adjusted_time * 1.618) + 1) / 2
-            
-        elif pattern_type == "heartbeat":
-            # Double pulse like heartbeat
-            cycle = adjusted_time % (2 * math.pi)
-            if cycle < 0.3:
-                return math.sin(cycle * 10) ** 2
-            elif cycle < 0.8:
-                return math.sin((cycle - 0.3) * 12) ** 2
-            else:
-                return 0.0
-                
-        return 0.5  # Default fallback
+        return self._pattern_fn(time_val * rate_factor)
     
-    def pattern_worker(self):
-        """Pattern generation worker thread"""
-        self.logger.info("Pattern worker thread started")
+    async def pattern_task(self):
+        """Pattern generation task on the event loop"""
+        self.logger.info("Pattern task started")
         
-        last_send_time = 0
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        while self.pattern_enabled and self.running:
-            try:
-                current_time = time.time()
-                self.pattern_time = current_time - start_time
-                
-                # Get current pattern settings
-                max_intensity = float(self.pattern_intensity.get()) / 100.0
-                rate_factor = float(self.pattern_rate.get()) / 100.0
-                randomness = float(self.pattern_randomness.get()) / 100.0
-                
-                # Generate base pattern value (0.0 to 1.0)
-                base_value = self.generate_pattern_value(self.pattern_time, self.pattern_type, rate_factor)
-                
-                # Apply randomness if enabled
-                if randomness > 0:
-                    import random
-                    random_offset = (random.random() - 0.5) * 2 * randomness * 0.3  # Scale randomness
-                    base_value = max(0.0, min(1.0, base_value + random_offset))
-                
-                # Scale by max intensity
-                self.pattern_current_intensity = base_value * max_intensity
-                
-                if self._cached_verbose_logging:
-                    self.logger.debug(f"Pattern - Type: {self.pattern_type}, Base: {base_value:.3f}, "
-                                    f"Final: {self.pattern_current_intensity:.3f}")
-                
-                # Update UI
-                pattern_percentage = self.pattern_current_intensity * 100
+        try:
+            while self.pattern_enabled and self.running:
                 try:
-                    self.ui_update_queue.put(lambda: self.pattern_level_var.set(pattern_percentage))
-                except queue.Full:
-                    pass  # Skip update if queue is full
-                
-                # Send to device with rate limiting
-                send_interval = 1.0 / self.update_rate
-                should_send = (self.device and self.pattern_enabled and 
-                             current_time - last_send_time >= send_interval)
-                
-                if should_send:
+                    current_time = time.monotonic()
+                    self.pattern_time = current_time - start_time
+                    
+                    # Get current pattern settings, cached by the Tk traces
+                    max_intensity = self._cached_pattern_intensity / 100.0
+                    rate_factor = self._cached_pattern_rate / 100.0
+                    randomness = self._cached_pattern_randomness / 100.0
+                    
+                    # Generate base pattern value (0.0 to 1.0)
+                    base_value = self.generate_pattern_value(self.pattern_time, rate_factor)
+                    
+                    # Apply randomness if enabled
+                    if randomness > 0:
+                        noise = self._noise[self._noise_index]
+                        self._noise_index = (self._noise_index + 1) & (PATTERN_NOISE_SIZE - 1)
+                        if self._noise_index == 0:
+                            self._noise = self._rng.random(PATTERN_NOISE_SIZE).tolist()
+                        random_offset = (noise - 0.5) * 2 * randomness * 0.3  # Scale randomness
+                        base_value = max(0.0, min(1.0, base_value + random_offset))
+                    
+                    # Scale by max intensity
+                    self.pattern_current_intensity = base_value * max_intensity
+                    
                     if self._cached_verbose_logging:
-                        self.logger.debug(f"Sending pattern to device - Intensity: {self.pattern_current_intensity:.4f}")
+                        self.logger.debug(f"Pattern - Type: {self.pattern_type}, Base: {base_value:.3f}, "
+                                        f"Final: {self.pattern_current_intensity:.3f}")
                     
-                    # Queue device update instead of calling tkinter directly
-                    try:
-                        self.ui_update_queue.put(self.update_device_from_pattern)
-                    except queue.Full:
-                        pass  # Skip update if queue is full
-                    last_send_time = current_time
+                    # Update UI on its next tick
+                    self._ui_snapshot["pattern"] = self.pattern_current_intensity * 100
                     
-            except Exception as e:
-                if self.pattern_enabled:
-                    self.log_exception("pattern_worker", exc_info=True)
-                break
+                    # Publish to the sender, which rate limits device commands
+                    if self.device and self.pattern_enabled:
+                        if self._cached_verbose_logging:
+                            self.logger.debug(f"Sending pattern to device - Intensity: {self.pattern_current_intensity:.4f}")
+                        
+                        self.update_device_from_pattern()
+                        
+                except Exception as e:
+                    if self.pattern_enabled:
+                        self.log_exception("pattern_task", exc_info=True)
+                    break
+                    
+                await asyncio.sleep(0.05)  # 20Hz update rate for smooth patterns
                 
-            time.sleep(0.05)  # 20Hz update rate for smooth patterns
-            
-        self.logger.info("Pattern worker thread ended")
+        finally:
+            self.logger.info("Pattern task ended")
         
     def update_device_from_pattern(self):
         """Update device intensity from pattern"""
         try:
             if self.device and self.connected:
                 # Combine pattern, audio, and manual intensity (max of all)
-                manual_val = float(self.intensity.get()) / 100.0
+                manual_val = self.manual_intensity
                 combined_intensity = max(self.pattern_current_intensity, self.audio_intensity, manual_val)
                 
                 if self._cached_verbose_logging:
@@ -1146,18 +1304,35 @@ class MuchFunApp:
                                     f"Audio: {self.audio_intensity:.3f}, Manual: {manual_val:.3f}, "
                                     f"Combined: {combined_intensity:.3f}")
                 
-                self.run_async(self.send_intensity(combined_intensity))
+                self.request_intensity(combined_intensity)
         except Exception as e:
             self.log_exception("update_device_from_pattern", exc_info=True)
         
-    def audio_worker(self):
-        """Audio processing worker thread with frequency analysis"""
-        self.logger.info("Audio worker thread started")
+    def audio_callback(self, in_data, frame_count, time_info, status):
+        """Hand each captured block to the event loop without blocking PortAudio"""
+        loop = self.loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.queue_audio_block, in_data)
+        return None, pyaudio.paContinue
+        
+    def queue_audio_block(self, data):
+        """Queue a captured block on the event loop, dropping the oldest when full"""
+        if self._audio_queue.full():
+            # The audio task only needs recent audio
+            self._audio_queue.get_nowait()
+        self._audio_queue.put_nowait(data)
+        
+    async def audio_task(self):
+        """Audio processing task with frequency analysis"""
+        self.logger.info("Audio task started")
+        
+        # Discard blocks left over from a previous run
+        while not self._audio_queue.empty():
+            self._audio_queue.get_nowait()
         
         # Audio smoothing variables
         smoothed_intensity = 0.0
-        last_send_time = 0
-        last_process_time = time.time()
+        last_process_time = time.monotonic()
         
         # Noise floor - ignore anything below this threshold
         noise_floor = 0.03  # Ignore audio below 3% to filter background noise
@@ -1165,115 +1340,137 @@ class MuchFunApp:
         # Reduced logging frequency
         log_counter = 0
         
-        while self.audio_enabled and self.stream and self.running:
-            try:
-                current_time = time.time()
-                delta_time = current_time - last_process_time
-                last_process_time = current_time
-                
-                if self.stream.is_stopped():
-                    self.logger.warning("Audio stream is stopped, breaking from worker loop")
-                    break
-                    
-                data = self.stream.read(1024, exception_on_overflow=False)
-                audio_data = np.frombuffer(data, dtype=np.float32)
-                
-                # NEW: Analyze frequency bands
-                bass, mids, treble, viz_data = self.analyze_frequency_bands(audio_data, 44100)
-                
-                # Store frequency data
-                self.bass_energy = bass
-                self.mids_energy = mids
-                self.treble_energy = treble
-                self.visualizer_data = viz_data
-                
-                # Calculate mixed intensity based on frequency focus
-                focus_value = self._cached_frequency_focus  # Use cached value instead of direct tkinter access
-                frequency_mix = self.calculate_frequency_mix(bass, mids, treble, focus_value)
-                
-                # Apply sensitivity
-                sensitivity_factor = self._cached_sensitivity / 100.0  # Use cached value
-                target_intensity = frequency_mix * sensitivity_factor
-                
-                # Apply noise floor
-                if target_intensity < noise_floor:
-                    target_intensity = 0.0
-                
-                # Apply smoothing
-                smoothed_intensity = self.apply_audio_smoothing(
-                    smoothed_intensity, target_intensity, delta_time
-                )
-                
-                # Cap the intensity at a reasonable maximum
-                self.audio_intensity = float(min(1.0, smoothed_intensity))  # Ensure it's between 0.0 and 1.0
-                
-                # More frequent logging for debugging and better UI updates
-                log_counter += 1
-                if self._cached_verbose_logging and log_counter % 50 == 0:  # Use cached value instead
-                    self.logger.debug(f"Audio - Bass: {bass:.3f}, Mids: {mids:.3f}, Treble: {treble:.3f}, "
-                                    f"Focus: {focus_value:.2f}, Mixed: {frequency_mix:.3f}, "
-                                    f"Sensitivity: {sensitivity_factor:.2f}, Final: {self.audio_intensity:.3f}")
-                    # Also log what we're setting the UI bars to
-                    self.logger.debug(f"UI Update - Bass bar: {bass*100:.1f}%, Mids bar: {mids*100:.1f}%, "
-                                    f"Treble bar: {treble*100:.1f}%, Mixed bar: {frequency_mix*100:.1f}%")
-                
-                # Update UI frequency indicators using queue for thread safety
-                bass_pct = bass * 100
-                mids_pct = mids * 100  
-                treble_pct = treble * 100
-                mix_pct = frequency_mix * 100
-                smoothed_pct = self.audio_intensity * 100
-                
-                # Queue UI updates instead of calling tkinter directly
+        # Consecutive blocks with nothing to play, the task polls slower once the mic is idle
+        silent_blocks = 0
+        
+        try:
+            while self.audio_enabled and self.stream and self.running:
                 try:
-                    self.ui_update_queue.put(lambda: self.bass_var.set(bass_pct))
-                    self.ui_update_queue.put(lambda: self.mids_var.set(mids_pct))
-                    self.ui_update_queue.put(lambda: self.treble_var.set(treble_pct))
-                    self.ui_update_queue.put(lambda: self.audio_level_var.set(mix_pct))
-                    self.ui_update_queue.put(lambda: self.smoothed_value_var.set(smoothed_pct))
-                except queue.Full:
-                    pass  # Skip updates if queue is full
-                
-                # Send to device with configurable rate limiting (5 commands/sec)
-                send_interval = 1.0 / self.update_rate  # 0.2 seconds for 5 commands/sec
-                should_send = (self.device and self.audio_enabled and 
-                             current_time - last_send_time >= send_interval)
-                
-                if should_send and (self.audio_intensity > 0.0 or 
-                   (hasattr(self, '_last_sent_intensity') and self._last_sent_intensity > 0.0)):
+                    if self.stream.is_stopped():
+                        self.logger.warning("Audio stream is stopped, breaking from worker loop")
+                        break
+                        
+                    # Wait for the next block
+                    try:
+                        data = await asyncio.wait_for(self._audio_queue.get(), timeout=0.5)
+                    except asyncio.TimeoutError:
+                        continue
                     
-                    if self._cached_verbose_logging:  # Use cached value instead
-                        self.logger.debug(f"Sending to device - Intensity: {self.audio_intensity:.4f}")
+                    if silent_blocks >= 10:
+                        # Idle, every block since the last poll goes through the cheap RMS
+                        # gate so a short onset in any of them wakes the task
+                        loud = None
+                        while True:
+                            if not _is_silent(np.frombuffer(data, dtype=np.float32)):
+                                loud = data
+                            if self._audio_queue.empty():
+                                break
+                            data = self._audio_queue.get_nowait()
+                        if loud is None:
+                            # Still silent, nothing changed for the UI or the device
+                            last_process_time = time.monotonic()
+                            await asyncio.sleep(0.2)
+                            continue
+                        data = loud
+                    else:
+                        # Skip to the newest if several are queued
+                        while not self._audio_queue.empty():
+                            data = self._audio_queue.get_nowait()
+                            
+                    current_time = time.monotonic()
+                    delta_time = current_time - last_process_time
+                    last_process_time = current_time
                     
-                    # Queue device update instead of calling tkinter directly
-                    try:
-                        self.ui_update_queue.put(self.update_device_from_audio)
-                    except queue.Full:
-                        pass  # Skip update if queue is full
-                    last_send_time = current_time
-                    self._last_sent_intensity = self.audio_intensity
+                    # float32 samples are used in place, frombuffer is a view and not a copy
+                    audio_data = np.frombuffer(data, dtype=np.float32)
                     
-            except Exception as e:
-                if self.audio_enabled:  # Only show error if we're supposed to be running
-                    self.log_exception("audio_worker", exc_info=True)
-                break
+                    # NEW: Analyze frequency bands
+                    bass, mids, treble, spectrum = self.analyze_frequency_bands(audio_data, AUDIO_RATE)
+                    
+                    # Store frequency data
+                    self.bass_energy = bass
+                    self.mids_energy = mids
+                    self.treble_energy = treble
+                    self.visualizer_spectrum = spectrum  # One reference swap, read by update_visualizer
+                    
+                    # Calculate mixed intensity based on frequency focus
+                    focus_value = self._cached_frequency_focus  # Use cached value instead of direct tkinter access
+                    frequency_mix = self.calculate_frequency_mix(bass, mids, treble)
+                    
+                    # Apply sensitivity
+                    sensitivity_factor = self._cached_sensitivity / 100.0  # Use cached value
+                    target_intensity = frequency_mix * sensitivity_factor
+                    
+                    # Apply noise floor
+                    if target_intensity < noise_floor:
+                        target_intensity = 0.0
+                    
+                    # Apply smoothing
+                    smoothed_intensity = self.apply_audio_smoothing(
+                        smoothed_intensity, target_intensity, delta_time
+                    )
+                    
+                    # Cap the intensity at a reasonable maximum
+                    self.audio_intensity = float(min(1.0, smoothed_intensity))  # Ensure it's between 0.0 and 1.0
+                    
+                    if target_intensity == 0.0 and self.audio_intensity == 0.0:
+                        silent_blocks += 1
+                    else:
+                        silent_blocks = 0
+                    
+                    # More frequent logging for debugging and better UI updates
+                    log_counter += 1
+                    if self._cached_verbose_logging and log_counter % 50 == 0:  # Use cached value instead
+                        self.logger.debug(f"Audio - Bass: {bass:.3f}, Mids: {mids:.3f}, Treble: {treble:.3f}, "
+                                        f"Focus: {focus_value:.2f}, Mixed: {frequency_mix:.3f}, "
+                                        f"Sensitivity: {sensitivity_factor:.2f}, Final: {self.audio_intensity:.3f}")
+                        # Also log what we're setting the UI bars to
+                        self.logger.debug(f"UI Update - Bass bar: {bass*100:.1f}%, Mids bar: {mids*100:.1f}%, "
+                                        f"Treble bar: {treble*100:.1f}%, Mixed bar: {frequency_mix*100:.1f}%")
+                    
+                    # Update UI frequency indicators on the next UI tick, Tk is never called from here
+                    snapshot = self._ui_snapshot
+                    snapshot["bass"] = bass * 100
+                    snapshot["mids"] = mids * 100
+                    snapshot["treble"] = treble * 100
+                    snapshot["audio"] = frequency_mix * 100
+                    snapshot["smoothed"] = self.audio_intensity * 100
+                    
+                    # Publish to the sender, which rate limits device commands
+                    should_send = self.device and self.audio_enabled
+                    
+                    if should_send and (self.audio_intensity > 0.0 or 
+                       self._last_sent_intensity > 0.0):
+                        
+                        if self._cached_verbose_logging:  # Use cached value instead
+                            self.logger.debug(f"Sending to device - Intensity: {self.audio_intensity:.4f}")
+                        
+                        self.update_device_from_audio()
+                        self._last_sent_intensity = self.audio_intensity
+                        
+                except Exception as e:
+                    if self.audio_enabled:  # Only show error if we're supposed to be running
+                        self.log_exception("audio_task", exc_info=True)
+                    break
+                    
+                # 25Hz update rate for audio processing, 5Hz polling after 10 silent blocks (0.4s)
+                await asyncio.sleep(0.2 if silent_blocks >= 10 else 0.04)
                 
-            time.sleep(0.04)  # 25Hz update rate for audio processing
-            
-        self.logger.info("Audio worker thread ended")
+        finally:
+            self.logger.info("Audio task ended")
             
     def update_device_from_audio(self):
         """Update device intensity from audio input"""
         try:
             if self.device and self.connected:
                 # Combine audio and manual intensity (max of both)
-                manual_val = float(self.intensity.get()) / 100.0
+                manual_val = self.manual_intensity
                 combined_intensity = max(self.audio_intensity, manual_val)
                 
                 if self._cached_verbose_logging:
                     self.logger.debug(f"Device update - Audio: {self.audio_intensity:.3f}, Manual: {manual_val:.3f}, Combined: {combined_intensity:.3f}")
                 
-                self.run_async(self.send_intensity(combined_intensity))
+                self.request_intensity(combined_intensity)
         except Exception as e:
             self.log_exception("update_device_from_audio", exc_info=True)
             
@@ -1287,91 +1484,139 @@ class MuchFunApp:
             
             if self.device and self.connected and not self.audio_enabled and not self.pattern_enabled:
                 # Only send manual control if audio and pattern are not enabled
-                self.run_async(self.send_intensity(self.manual_intensity))
+                self.request_intensity(self.manual_intensity)
         except Exception as e:
             self.log_exception("manual_intensity_changed", exc_info=True)
             
-    async def send_intensity(self, intensity):
-        """Send intensity to device"""
+    def request_intensity(self, intensity):
+        """Set the intensity the sender task will send next, superseding any unsent value"""
+        self._pending_intensity = intensity
+        dirty = self._dirty
+        if dirty is None:
+            return  # Loop not running yet, the sender picks the value up on its next wakeup
+        if threading.current_thread() is self.loop_thread:
+            # Audio and pattern tasks already run on the loop, no wakeup needed
+            dirty.set()
+        elif self.loop:
+            self.loop.call_soon_threadsafe(dirty.set)
+            
+    async def sender_task(self):
+        """Send the latest requested intensity, at most update_rate times per second"""
+        while self.running:
+            await self._dirty.wait()
+            self._dirty.clear()
+            if await self.send_intensity(self._pending_intensity, self._stop_generation):
+                await asyncio.sleep(1.0 / self.update_rate)
+            
+    async def send_intensity(self, intensity, generation):
+        """Send intensity to device unless an emergency stop came after generation,
+        returns whether a command was sent"""
         try:
             if self.device and len(self.device.actuators) > 0:
                 # Quantize to 100 steps for smoother control
                 step = round(intensity * 99)
+                
+                # A change below one step is not noticeable, the device already runs at this level
+                if step == self._last_sent_step:
+                    return False
                 quantized_intensity = step / 99.0
 
                 if self._cached_verbose_logging:
                     self.logger.debug(f"Sending intensity {step} to device")
                 
-                await self.device.actuators[0].command(quantized_intensity)
+                async with self._device_lock:
+                    # An emergency stop issued meanwhile wins over this older value
+                    if generation != self._stop_generation:
+                        return False
+                    await self.device.actuators[0].command(quantized_intensity)
+                    self._last_sent_step = step
                 self.commands_sent += 1
-                
-                
-               
+                return True
                 
         except Exception as e:
             self.log_exception("send_intensity", exc_info=True)
-            error_msg = f"Device error: {e}"
-            self.root.after(0, lambda msg=error_msg: self.status_text.set(msg))
+            self.post_status(f"Device error: {e}")
+        return False
             
     def emergency_stop(self):
         """Emergency stop - immediately stop device"""
         try:
             self.logger.warning("EMERGENCY STOP ACTIVATED")
             
-            if self.device:
-                self.run_async(self.device.stop())
             self.intensity.set(0)
             self.manual_intensity = 0.0
             self.audio_enabled_var.set(False)
             self.pattern_enabled_var.set(False)
             
             # Reset smoothing state
-            if hasattr(self, '_audio_velocity'):
-                self._audio_velocity = 0.0
+            self._audio_velocity = 0.0
             
-            # Safely stop all control methods
+            # Turn the producers off first, so none can request a new intensity after the stop
             try:
                 self.stop_audio()
                 self.stop_pattern()
             except Exception as e:
                 self.log_exception("emergency_stop cleanup", exc_info=True)
                 
+            # Drop any intensity still waiting to be sent, stop_device repeats this on the loop
+            self._pending_intensity = 0.0
+            self.run_async(self.stop_device(self.device))
+            
             self.status_text.set("EMERGENCY STOP ACTIVATED")
             self.logger.info("Emergency stop completed")
         except Exception as e:
             self.log_exception("emergency_stop", exc_info=True)
         
+    async def stop_device(self, device):
+        """Drop any unsent intensity, then stop the device once a command already being sent has gone out"""
+        # Runs on the loop with the producer tasks, whose cancellation was scheduled
+        # before this, so no new value can slip in between the reset and the stop
+        self._pending_intensity = 0.0
+        self._dirty.clear()
+        self._stop_generation += 1
+        if device:
+            async with self._device_lock:
+                await device.stop()
+                self._last_sent_step = 0
+            
+    def bind_label_update(self, scale, update_label):
+        """Refresh a slider's label once the user lets go instead of on every pixel of a drag"""
+        scale.bind("<ButtonRelease-1>", update_label, add="+")
+        scale.bind("<KeyRelease>", update_label, add="+")
+        
+    def set_label_text(self, label, text):
+        """Set a label's text, skipping the Tcl call when it already shows it"""
+        if self._label_texts.get(label) != text:
+            label.config(text=text)
+            self._label_texts[label] = text
+        
     def update_sensitivity_label(self, *args):
         """Update sensitivity label"""
-        self.sensitivity_label.config(text=f"{int(self.sensitivity.get())}%")
+        self.set_label_text(self.sensitivity_label, f"{int(self.sensitivity.get())}%")
         
     def update_intensity_label(self, *args):
         """Update intensity label"""
-        self.intensity_label.config(text=f"{int(self.intensity.get())}%")
+        self.set_label_text(self.intensity_label, f"{int(self.intensity.get())}%")
         
     def update_pattern_intensity_label(self, *args):
         """Update pattern intensity label"""
-        self.pattern_intensity_label.config(text=f"{int(self.pattern_intensity.get())}%")
+        self.set_label_text(self.pattern_intensity_label, f"{int(self.pattern_intensity.get())}%")
         
     def update_pattern_rate_label(self, *args):
         """Update pattern rate label"""
-        self.pattern_rate_label.config(text=f"{int(self.pattern_rate.get())}%")
+        self.set_label_text(self.pattern_rate_label, f"{int(self.pattern_rate.get())}%")
         
     def update_randomness_label(self, *args):
         """Update randomness label"""
-        self.randomness_label.config(text=f"{int(self.pattern_randomness.get())}%")
+        self.set_label_text(self.randomness_label, f"{int(self.pattern_randomness.get())}%")
         
     def update_frequency_focus_label(self, *args):
         """Update frequency focus label"""
         try:
             focus_value = self.frequency_focus.get()
-            if focus_value < -0.3:
-                label = "Bass"
-            elif focus_value > 0.3:
-                label = "Treble"
-            else:
-                label = "Mids"
-            self.frequency_focus_label.config(text=label)
+            # Below -0.3 is Bass, above 0.3 is Treble, Mids in between (inclusive)
+            label = FOCUS_LABELS[(focus_value >= -0.3) + (focus_value > 0.3)]
+            self.set_label_text(self.frequency_focus_label, label)
         except:
             pass  # Ignore errors during shutdown
         
@@ -1386,6 +1631,16 @@ class MuchFunApp:
         """Cache frequency focus value for thread-safe access"""
         try:
             self._cached_frequency_focus = self.frequency_focus.get()
+            self._cached_mix_weights = self.frequency_mix_weights(self._cached_frequency_focus)
+        except:
+            pass  # Ignore errors during shutdown
+            
+    def cache_pattern_values(self, *args):
+        """Cache pattern slider values for thread-safe access"""
+        try:
+            self._cached_pattern_intensity = float(self.pattern_intensity.get())
+            self._cached_pattern_rate = float(self.pattern_rate.get())
+            self._cached_pattern_randomness = float(self.pattern_randomness.get())
         except:
             pass  # Ignore errors during shutdown
             
@@ -1395,19 +1650,11 @@ class MuchFunApp:
             self._cached_verbose_logging = self.verbose_logging.get()
         except:
             pass  # Ignore errors during shutdown
-        """Update frequency focus label"""
-        focus_value = self.frequency_focus.get()
-        if focus_value < -0.3:
-            label = "Bass"
-        elif focus_value > 0.3:
-            label = "Treble"
-        else:
-            label = "Mids"
-        self.frequency_focus_label.config(text=label)
         
     def on_pattern_type_changed(self, event=None):
         """Handle pattern type selection change"""
         self.pattern_type = self.pattern_type_var.get()
+        self._pattern_fn = PATTERN_GENERATORS.get(self.pattern_type, _fallback_pattern)
         self.logger.info(f"Pattern type changed to: {self.pattern_type}")
         # Reset pattern time when changing type for immediate effect
         self.pattern_time = 0.0
@@ -1415,12 +1662,13 @@ class MuchFunApp:
     def on_smoothing_type_changed(self, event=None):
         """Handle smoothing type selection change"""
         self.smoothing_type = self.smoothing_type_var.get()
+        self._smooth_fn = SMOOTHING_KERNELS.get(self.smoothing_type, _smooth_none)
         self.logger.info(f"Smoothing type changed to: {self.smoothing_type}")
         
     def on_smoothing_strength_changed(self, value):
         """Handle smoothing strength slider change"""
         self.smoothing_strength = float(value) / 100.0
-        self.smoothing_strength_label.config(text=f"{int(float(value))}%")
+        self.set_label_text(self.smoothing_strength_label, f"{int(float(value))}%")
         if self._cached_verbose_logging:
             self.logger.debug(f"Smoothing strength changed to: {self.smoothing_strength:.2f}")
         
@@ -1435,19 +1683,35 @@ class MuchFunApp:
         self.stop_audio()
         self.stop_pattern()
         
-        # Disconnect from server
-        if self.connected:
-            self.run_async(self.disconnect_from_server())
+        # Cancel every loop task before blocking on the shutdown below, a task still
+        # running could post_status to Tk, which cannot run while this waits
+        for future in (self.sender_future, self.audio_future, self.pattern_future):
+            if future:
+                future.cancel()
+        self.sender_future = self.audio_future = self.pattern_future = None
+        
+        # Stop the device and disconnect before the loop goes away, so the device is
+        # not left running. Bounded, a stuck server must not hang the window
+        if self.connected and self.loop:
+            try:
+                self.run_async(self.shutdown_connection()).result(timeout=3.0)
+            except Exception as e:
+                self.log_exception("on_closing disconnect", exc_info=True)
             
         # Clean up audio
         if self.audio:
             self.audio.terminate()
             
-        # Stop async loop
+        # Stop async loop and wait for its thread to finish
         if self.loop:
             self.loop.call_soon_threadsafe(self.loop.stop)
+            if self.loop_thread:
+                self.loop_thread.join(timeout=1.0)
             
         self.root.destroy()
+        
+        # Flush any queued log records
+        self._log_listener.stop()
 
 def main():
     """Main function"""
@@ -1455,10 +1719,9 @@ def main():
     try:
         import pyaudio
         import numpy as np
-        import matplotlib.pyplot as plt
     except ImportError as e:
         print("Missing required packages. Please install:")
-        print("pip install pyaudio numpy matplotlib")
+        print("pip install pyaudio numpy")
         print(f"Error: {e}")
         return
         
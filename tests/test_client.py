@@ -0,0 +1,108 @@
+from json import dumps as json_dumps, loads as json_loads
+from unittest import IsolatedAsyncioTestCase, main
+
+from buttplug import Client, ProtocolSpec
+from buttplug.connectors import Connector
+from buttplug.messages import v3
+
+
+class FakeServerConnector(Connector):
+    """Connector that answers every packet as a minimal Buttplug server would."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.packets: list[list[dict]] = []
+        self.devices: list[dict] = []
+
+    async def connect(self) -> None:
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        self._connected = False
+
+    async def send(self, message: str) -> None:
+        packet = json_loads(message)
+        self.packets.append(packet)
+        await self._callback(json_dumps([self.reply(m) for m in packet]))
+
+    def reply(self, message: dict) -> dict:
+        (message_type, fields), = message.items()
+        if message_type == 'RequestServerInfo':
+            return {'ServerInfo': {
+                'Id': fields['Id'],
+                'ServerName': 'Test Server',
+                'MessageVersion': 3,
+                'MaxPingTime': 0,
+            }}
+        if message_type == 'RequestDeviceList':
+            return {'DeviceList': {'Id': fields['Id'], 'Devices': self.devices}}
+        return {'Ok': {'Id': fields['Id']}}
+
+
+class TestClient(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.connector = FakeServerConnector()
+        self.connector.devices.append({
+            'DeviceName': 'Test Device',
+            'DeviceIndex': 0,
+            'DeviceMessages': {
+                'StopDeviceCmd': {},
+                'RawWriteCmd': [{'Endpoint': ['tx', 'cmd']}],
+                'RawReadCmd': [{'Endpoint': ['rx']}],
+                'RawSubscribeCmd': [{'Endpoint': ['rx']}],
+                'RawUnsubscribeCmd': [{'Endpoint': ['rx']}],
+            },
+        })
+        self.client = Client('Test Client', ProtocolSpec.v3)
+        await self.client.connect(self.connector)
+        self.connector.packets.clear()
+
+    async def test_send(self):
+        reply = await self.client.send(v3.StopAllDevices())
+        self.assertIsInstance(reply, v3.Ok)
+        self.assertEqual(len(self.connector.packets), 1)
+
+    async def test_send_many(self):
+        messages = [v3.StopDeviceCmd(0), v3.StopDeviceCmd(1), v3.StopAllDevices()]
+        replies = await self.client.send_many(messages)
+        self.assertEqual(len(self.connector.packets), 1)
+        self.assertEqual(len(self.connector.packets[0]), 3)
+        self.assertEqual([reply.id for reply in replies], [message.id for message in messages])
+        for reply in replies:
+            self.assertIsInstance(reply, v3.Ok)
+
+    async def test_send_many_empty(self):
+        self.assertEqual(await self.client.send_many([]), [])
+        self.assertEqual(self.connector.packets, [])
+
+    async def test_send_many_send_error(self):
+        async def fail(message: str) -> None:
+            raise ConnectionError('gone')
+
+        self.connector.send = fail
+        with self.assertRaises(ConnectionError):
+            await self.client.send_many([v3.StopDeviceCmd(0), v3.StopAllDevices()])
+        self.assertEqual(self.client._tasks, {})
+
+    def test_raw_endpoints(self):
+        device = self.client.devices[0]
+        self.assertEqual(device.raw_write_endpoints, ('tx', 'cmd'))
+        self.assertEqual(device.raw_read_endpoints, ('rx',))
+        self.assertEqual(device.raw_subscribe_endpoints, ('rx',))
+
+    async def test_raw_subscribe(self):
+        device = self.client.devices[0]
+        received = []
+        await device.raw_subscribe('rx', received.append)
+        await self.connector.callback(json_dumps([
+            {'RawReading': {'Id': 0, 'DeviceIndex': 0, 'Endpoint': 'rx', 'Data': [1, 2, 3]}},
+        ]))
+        self.assertEqual(received, [[1, 2, 3]])
+
+        await device.raw_unsubscribe('rx')
+        with self.assertRaises(KeyError):
+            device.raw_callback('rx')
+
+
+if __name__ == '__main__':
+    main()